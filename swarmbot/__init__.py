@@ -15,7 +15,24 @@ try:
 except Exception:
     pass
 
-from .core.agent import CoreAgent
-from .swarm.manager import SwarmManager
-from .memory.base import MemoryStore
-from .memory.qmd import QMDMemoryStore
+# Public classes are resolved lazily (PEP 562) so lightweight entry points such as
+# `swarmbot status` do not pay for importing the agent/LLM/memory stack.
+_LAZY_EXPORTS = {
+    "CoreAgent": ".core.agent",
+    "SwarmManager": ".swarm.manager",
+    "MemoryStore": ".memory.base",
+    "QMDMemoryStore": ".memory.qmd",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
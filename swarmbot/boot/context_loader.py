@@ -3,6 +3,10 @@ from __future__ import annotations
 import os
 from typing import Dict, List
 
+from ..config_manager import BOOT_CONFIG_PATH
+
+_PKG_BOOT_DIR = os.path.dirname(__file__)
+
 _ALLOWED: Dict[str, List[str]] = {
     "swarm_manager": ["swarmboot.md", "masteragentboot.md", "SOUL.md"],
     "inference_loop": ["swarmboot.md", "SOUL.md"],
@@ -14,8 +18,8 @@ def load_boot_markdown(filename: str, module: str, max_chars: int = 12000) -> st
     allowed = _ALLOWED.get(module, [])
     if filename not in allowed:
         return ""
-    user_boot = os.path.expanduser(f"~/.swarmbot/boot/{filename}")
-    pkg_boot = os.path.join(os.path.dirname(__file__), filename)
+    user_boot = os.path.join(BOOT_CONFIG_PATH, filename)
+    pkg_boot = os.path.join(_PKG_BOOT_DIR, filename)
     content = ""
     try:
         if os.path.exists(user_boot):
@@ -1,15 +1,12 @@
 from __future__ import annotations
 
 import argparse
-import json
-import subprocess
 import sys
-import time
 import os
-import readline  # Enable arrow keys and better input handling
+from dataclasses import asdict
 
 from .config_manager import (
-    SwarmbotConfig,
+    ChannelConfig,
     load_config,
     save_config,
     ensure_dirs,
@@ -17,40 +14,39 @@ from .config_manager import (
     BOOT_CONFIG_PATH,
     WORKSPACE_PATH,
 )
-from .swarm.manager import SwarmManager
-from .loops.inference import InferenceLoop
-import shutil
-
+from .json_compat import dumps as json_dumps, loads as json_loads
+
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_PKG_BOOT_DIR = os.path.join(_MODULE_DIR, "boot")
+
+_ARCHITECTURES: tuple[str, ...] = (
+    "auto",
+    "sequential",
+    "concurrent",
+    "agent_rearrange",
+    "graph",
+    "mixture",
+    "group_chat",
+    "forest",
+    "hierarchical",
+    "heavy",
+    "swarm_router",
+    "long_horizon",
+    "state_machine",
+)
 
-def load_nanobot_config() -> dict:
-    cfg = load_config()
-    channels_dict = {}
-    for name, c_cfg in cfg.channels.items():
-        channels_dict[name] = c_cfg.config.copy()
-        channels_dict[name]["enabled"] = c_cfg.enabled
-    return {"channels": channels_dict}
 
-def save_nanobot_config(config: dict) -> None:
-    cfg = load_config()
-    
-    if "channels" in config:
-        for name, c_data in config["channels"].items():
-            # Update or create
-            enabled = c_data.get("enabled", False)
-            conf = {k:v for k,v in c_data.items() if k != "enabled"}
-            
-            # Update existing or create new
-            if name in cfg.channels:
-                cfg.channels[name].enabled = enabled
-                cfg.channels[name].config.update(conf)
-            else:
-                from .config_manager import ChannelConfig
-                cfg.channels[name] = ChannelConfig(enabled=enabled, config=conf)
-    
-    save_config(cfg)
+def _parse_kv(args: list[str]) -> dict[str, str]:
+    """Collect ``key=value`` arguments; tokens without ``=`` are ignored."""
+    return {k: v for k, sep, v in (arg.partition("=") for arg in args) if sep}
 
 
 def cmd_channels(args: argparse.Namespace, extra_args: list[str]) -> None:
+    interactive = "--interactive" in extra_args
+    quiet = "--quiet" in extra_args
+    if interactive or quiet:
+        extra_args = [a for a in extra_args if a not in ("--interactive", "--quiet")]
+
     if not extra_args:
         cmd_channels_list()
         return
@@ -61,11 +57,11 @@ def cmd_channels(args: argparse.Namespace, extra_args: list[str]) -> None:
         cmd_channels_list()
     elif action in ("add", "enable"):
         if len(extra_args) < 2:
-            print("Usage: swarmbot channels add <name> [key=value ...]")
+            print("Usage: swarmbot channels add <name> [key=value ...] [--interactive] [--quiet]")
             return
         name = extra_args[1]
         params = extra_args[2:]
-        cmd_channels_enable(name, params)
+        cmd_channels_enable(name, params, interactive=interactive, quiet=quiet)
     elif action in ("remove", "disable"):
         if len(extra_args) < 2:
             print("Usage: swarmbot channels remove <name>")
@@ -77,37 +73,24 @@ def cmd_channels(args: argparse.Namespace, extra_args: list[str]) -> None:
             print("Usage: swarmbot channels config <name> [key=value ...]")
             return
         name = extra_args[1]
-        params_list = extra_args[2:]
-        params = {}
-        for arg in params_list:
-            if "=" in arg:
-                k, v = arg.split("=", 1)
-                params[k] = v
-        cmd_channels_config(name, params)
+        cmd_channels_config(name, _parse_kv(extra_args[2:]))
     else:
         print(f"Unsupported channels action: {action}")
 
 def cmd_channels_list() -> None:
-    cfg = load_nanobot_config()
-    channels = cfg.get("channels", {})
+    cfg = load_config()
     print("Available Channels:")
     print(f"{'Name':<15} {'Status':<10} {'Config'}")
     print("-" * 50)
-    for name, data in channels.items():
-        status = "Enabled" if data.get("enabled") else "Disabled"
+    for name, ch in cfg.channels.items():
+        status = "Enabled" if ch.enabled else "Disabled"
         print(f"{name:<15} {status:<10}")
 
-def cmd_channels_enable(name: str, args: list[str]) -> None:
-    cfg = load_nanobot_config()
-    if "channels" not in cfg:
-        cfg["channels"] = {}
+def cmd_channels_enable(name: str, args: list[str], interactive: bool = False, quiet: bool = False) -> None:
+    cfg = load_config()
     
     # Process args first
-    params = {}
-    for arg in args:
-        if "=" in arg:
-            k, v = arg.split("=", 1)
-            params[k] = v
+    params = _parse_kv(args)
 
     if "appId" in params and "app_id" not in params:
         params["app_id"] = params.pop("appId")
@@ -122,15 +105,17 @@ def cmd_channels_enable(name: str, args: list[str]) -> None:
     if name == "feishu":
         # Required keys for Feishu (snake_case internally)
         required_keys = ["app_id", "app_secret"]
-        current_config = cfg.get("channels", {}).get(name, {})
+        current_config = cfg.channels[name].config if name in cfg.channels else {}
         
         # Check if user provided keys via args (camelCase or snake_case)
         # We already normalized params to snake_case above
         
-        missing = [k for k in required_keys if k not in params and k not in current_config]
-        
-        # If explicitly requested via add, or missing keys, trigger interactive
-        if missing or not params:
+        # Prompt only when asked to (--interactive) or when nothing was passed on
+        # the command line. Scripted `key=value` calls never block on stdin;
+        # they fail below if a required key is still missing.
+        if interactive or not params:
+            import readline  # noqa: F401  # line editing for the prompts below
+
             print(f"Configuring Feishu channel...")
             for k in required_keys:
                 if k not in params and k not in current_config:
@@ -148,12 +133,24 @@ def cmd_channels_enable(name: str, args: list[str]) -> None:
                 if val:
                     params["verification_token"] = val
 
-    if name not in cfg["channels"]:
+        # Don't enable a channel the gateway cannot connect with.
+        camel = {"app_id": "appId", "app_secret": "appSecret"}
+        missing = [
+            k for k in required_keys
+            if not (params.get(k) or current_config.get(k) or current_config.get(camel[k]))
+        ]
+        if missing:
+            print(f"Feishu channel not enabled: missing {', '.join(missing)}", file=sys.stderr)
+            print("Pass them as key=value arguments or run with --interactive.", file=sys.stderr)
+            sys.exit(1)
+
+    if name not in cfg.channels:
         print(f"Channel '{name}' not found in default config. Creating new entry...")
-        cfg["channels"][name] = {"enabled": True}
+        cfg.channels[name] = ChannelConfig()
     
-    cfg["channels"][name]["enabled"] = True
-    cfg["channels"][name].update(params)
+    ch = cfg.channels[name]
+    ch.enabled = True
+    ch.config.update(params)
     
     # Clean up any camelCase keys if they exist in the config to avoid duplication/confusion
     # The runtime expects snake_case
@@ -164,60 +161,67 @@ def cmd_channels_enable(name: str, args: list[str]) -> None:
         "verificationToken": "verification_token"
     }
     for camel, snake in camel_map.items():
-        if camel in cfg["channels"][name]:
+        if camel in ch.config:
             # If snake_case missing, move value over
-            if snake not in cfg["channels"][name]:
-                cfg["channels"][name][snake] = cfg["channels"][name][camel]
+            if snake not in ch.config:
+                ch.config[snake] = ch.config[camel]
             # Remove camelCase
-            del cfg["channels"][name][camel]
+            del ch.config[camel]
             
-    save_nanobot_config(cfg)
+    save_config(cfg)
     print(f"Channel '{name}' enabled and configured.")
     # Show Swarmbot config path now
     print(f"Configuration saved to: {CONFIG_PATH}")
-    # Also mirrored to ~/.nanobot/config.json for compatibility
-    print(json.dumps({name: cfg["channels"][name]}, ensure_ascii=False, indent=2))
+    # Echo the saved entry back; --quiet skips this second serialization.
+    if not quiet:
+        print(json_dumps({name: {**ch.config, "enabled": ch.enabled}}, indent=True))
 
 def cmd_channels_disable(name: str) -> None:
-    cfg = load_nanobot_config()
-    if "channels" in cfg and name in cfg["channels"]:
-        cfg["channels"][name]["enabled"] = False
-        save_nanobot_config(cfg)
+    cfg = load_config()
+    if name in cfg.channels:
+        cfg.channels[name].enabled = False
+        save_config(cfg)
         print(f"Channel '{name}' disabled.")
     else:
         print(f"Channel '{name}' is not enabled or does not exist.")
 
 def cmd_channels_config(name: str, params: dict) -> None:
-    cfg = load_nanobot_config()
-    if "channels" not in cfg or name not in cfg["channels"]:
+    cfg = load_config()
+    if name not in cfg.channels:
         print(f"Channel '{name}' not found. Please enable it first using 'add' or 'enable'.")
         return
         
-    for k, v in params.items():
-        cfg["channels"][name][k] = v
+    cfg.channels[name].config.update(params)
         
-    save_nanobot_config(cfg)
+    save_config(cfg)
     print(f"Channel '{name}' configuration updated.")
 
 
 def cmd_onboard() -> None:
+    import shutil
+
     ensure_dirs()
     cfg = load_config()
     save_config(cfg)
     
     # Init Boot Config: Copy default boot files to ~/.swarmbot/boot/ if not exist
-    pkg_boot_dir = os.path.join(os.path.dirname(__file__), "boot")
+    pkg_boot_dir = _PKG_BOOT_DIR
     if os.path.exists(pkg_boot_dir):
         print(f"Initializing boot configuration in {BOOT_CONFIG_PATH}...")
-        for filename in os.listdir(pkg_boot_dir):
-            if filename.endswith(".md"):
-                src = os.path.join(pkg_boot_dir, filename)
-                dst = os.path.join(BOOT_CONFIG_PATH, filename)
-                if not os.path.exists(dst):
-                    shutil.copy2(src, dst)
-                    print(f"  Created {filename}")
-                else:
-                    print(f"  Skipped {filename} (already exists)")
+        with os.scandir(pkg_boot_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".md") or not entry.is_file():
+                    continue
+                dst = os.path.join(BOOT_CONFIG_PATH, entry.name)
+                # Exclusive create doubles as the existence check (one syscall, no TOCTOU).
+                try:
+                    with open(dst, "xb") as fdst, open(entry.path, "rb") as fsrc:
+                        shutil.copyfileobj(fsrc, fdst)
+                except FileExistsError:
+                    print(f"  Skipped {entry.name} (already exists)")
+                    continue
+                shutil.copystat(entry.path, dst)
+                print(f"  Created {entry.name}")
     
     print(f"Swarmbot 已完成初始化，配置文件位于: {CONFIG_PATH}")
     print(f"个性化 Boot 配置位于: {BOOT_CONFIG_PATH}")
@@ -233,6 +237,7 @@ def cmd_run() -> None:
     - GatewayMasterAgent handles all routing and tool selection
     - InferenceLoop tools (Standard/Supervised/SwarmsWorker) are called by MasterAgent
     """
+    import readline  # noqa: F401  # Enable arrow keys and better input handling
     from .memory.session_memory import SessionMemory
     from .gateway.orchestrator import GatewayMasterAgent
 
@@ -302,12 +307,18 @@ def cmd_run() -> None:
         turn += 1
 
 
-import socket
-import os
-
 def check_port(port: int) -> bool:
+    import socket
+
+    # A bind attempt fails immediately with EADDRINUSE, whereas connect_ex can
+    # block on a filtered port and misreport a free port as busy.
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        return s.connect_ex(('127.0.0.1', port)) != 0
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            s.bind(('127.0.0.1', port))
+        except OSError:
+            return False
+        return True
 
 def get_available_port(start_port: int, step: int = 20, max_tries: int = 5) -> int:
     current_port = start_port
@@ -365,8 +376,10 @@ def cmd_cron(args: argparse.Namespace) -> None:
 def cmd_autonomous(args: argparse.Namespace) -> None:
     """Autonomous Engine 命令"""
     from .config_manager import CONFIG_HOME
+    from .shutdown import set_on_signals
     import signal
     import threading
+    import time
 
     pid_file = os.path.join(CONFIG_HOME, "autonomous.pid")
 
@@ -384,12 +397,7 @@ def cmd_autonomous(args: argparse.Namespace) -> None:
 
         # 启动
         stop_event = threading.Event()
-
-        def signal_handler(signum, frame):
-            stop_event.set()
-
-        signal.signal(signal.SIGTERM, signal_handler)
-        signal.signal(signal.SIGINT, signal_handler)
+        set_on_signals(stop_event)
 
         try:
             from .agents.autonomous import create_autonomous_engine
@@ -403,8 +411,8 @@ def cmd_autonomous(args: argparse.Namespace) -> None:
             print("Autonomous Engine 已启动")
             print("按 Ctrl+C 或发送 SIGTERM 停止")
 
-            while not stop_event.is_set():
-                time.sleep(1)
+            # Block until SIGTERM/SIGINT sets the event.
+            stop_event.wait()
 
         except KeyboardInterrupt:
             print("\n正在停止 Autonomous Engine...")
@@ -437,13 +445,15 @@ def cmd_autonomous(args: argparse.Namespace) -> None:
 
 def cmd_status() -> None:
     cfg = load_config()
-    print("Swarmbot 状态:")
-    print()
-    print("Providers:")
-    print(json.dumps([p.__dict__ for p in cfg.providers], ensure_ascii=False, indent=2))
-    print()
-    print("Swarm:")
-    print(json.dumps({"swarm": cfg.swarm.__dict__}, ensure_ascii=False, indent=2))
+    # Assemble the report and emit it with one write instead of a print per line.
+    parts = [
+        "Swarmbot 状态:\n\nProviders:\n",
+        json_dumps([asdict(p) for p in cfg.providers], indent=True),
+        "\n\nSwarm:\n",
+        json_dumps({"swarm": asdict(cfg.swarm)}, indent=True),
+        "\n",
+    ]
+    sys.stdout.write("".join(parts))
 
 
 
@@ -472,25 +482,19 @@ def cmd_provider_delete() -> None:
 
 def cmd_config(args: argparse.Namespace) -> None:
     cfg = load_config()
-    updated = False
-    if args.max_agents is not None:
-        cfg.swarm.max_agents = args.max_agents
-        updated = True
-    if args.architecture is not None:
-        cfg.swarm.architecture = args.architecture
-        updated = True
-    if args.max_turns is not None:
-        cfg.swarm.max_turns = args.max_turns
-        updated = True
-    if args.auto_builder is not None:
-        cfg.swarm.auto_builder = args.auto_builder
-        updated = True
-    if updated:
+    updates = {
+        k: v
+        for k in ("max_agents", "architecture", "max_turns", "auto_builder")
+        if (v := getattr(args, k)) is not None
+    }
+    if updates:
+        for k, v in updates.items():
+            setattr(cfg.swarm, k, v)
         save_config(cfg)
         print("已更新 Swarm 配置。")
     print()
     print("当前 Swarm 配置:")
-    print(json.dumps(cfg.swarm.__dict__, ensure_ascii=False, indent=2))
+    print(json_dumps(asdict(cfg.swarm), indent=True))
 
 
 def cmd_update() -> None:
@@ -507,7 +511,31 @@ def cmd_update() -> None:
     print("如果您是通过 pip 安装的，请使用 pip install --upgrade swarmbot")
 
 
+def _read_pid(path: str) -> int | None:
+    """Return the positive PID stored in ``path``, or None if absent/invalid."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            pid = int(f.read().strip() or "0")
+    except (OSError, ValueError):
+        return None
+    # os.kill() treats 0 and negative PIDs as process groups.
+    return pid if pid > 0 else None
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The process exists but belongs to another user.
+        return True
+    return True
+
+
 def cmd_daemon(args: argparse.Namespace) -> None:
+    import subprocess
+    import time
     from .config_manager import CONFIG_HOME, load_config, save_config
     pid_file = os.path.join(CONFIG_HOME, "daemon.pid")
     state_file = os.path.join(CONFIG_HOME, "daemon_state.json")
@@ -523,25 +551,27 @@ def cmd_daemon(args: argparse.Namespace) -> None:
             save_config(cfg)
         except Exception:
             pass
-        if os.path.exists(pid_file):
+        pid = _read_pid(pid_file)
+        if pid is not None and _alive(pid):
+            import signal
+
             try:
-                with open(pid_file, "r", encoding="utf-8") as f:
-                    pid = int(f.read().strip() or "0")
-                if pid > 0:
-                    import signal
-                    os.kill(pid, signal.SIGTERM)
-                    print(f"检测到已有 daemon 进程，正在关闭，PID={pid}")
-                    for _ in range(20):
-                        try:
-                            os.kill(pid, 0)
-                            time.sleep(0.2)
-                        except ProcessLookupError:
-                            break
-            except Exception:
-                try:
-                    os.remove(pid_file)
-                except Exception:
-                    pass
+                os.kill(pid, signal.SIGTERM)
+            except PermissionError:
+                print(f"已有 daemon 进程 (PID={pid}) 属于其他用户，无法关闭，取消启动。")
+                return
+            except ProcessLookupError:
+                pass
+            print(f"检测到已有 daemon 进程，正在关闭，PID={pid}")
+            for _ in range(20):
+                if not _alive(pid):
+                    break
+                time.sleep(0.2)
+        else:
+            try:
+                os.remove(pid_file)
+            except OSError:
+                pass
         cmd = [sys.executable, "-m", "swarmbot.daemon"]
         proc = subprocess.Popen(
             cmd,
@@ -555,23 +585,16 @@ def cmd_daemon(args: argparse.Namespace) -> None:
             return
         daemon_pid = None
         for _ in range(20):
-            try:
-                if os.path.exists(pid_file):
-                    with open(pid_file, "r", encoding="utf-8") as f:
-                        pid_txt = (f.read() or "").strip()
-                    pid_val = int(pid_txt or "0")
-                    if pid_val > 0:
-                        daemon_pid = pid_val
-                        break
-            except Exception:
-                pass
+            daemon_pid = _read_pid(pid_file)
+            if daemon_pid:
+                break
             time.sleep(0.2)
         gateway_ready = False
         for _ in range(30):
             try:
                 if os.path.exists(state_file):
-                    with open(state_file, "r", encoding="utf-8") as f:
-                        state = json.load(f)
+                    with open(state_file, "rb") as f:
+                        state = json_loads(f.read())
                     gw_pid = (
                         ((state.get("services") or {}).get("gateway") or {}).get("pid")
                     )
@@ -604,15 +627,11 @@ def cmd_daemon(args: argparse.Namespace) -> None:
         if not os.path.exists(pid_file):
             print("Swarmbot daemon 未在运行。")
             return
-        try:
-            with open(pid_file, "r", encoding="utf-8") as f:
-                pid = int(f.read().strip() or "0")
-        except Exception:
-            pid = 0
-        if pid <= 0:
+        pid = _read_pid(pid_file)
+        if pid is None:
             try:
                 os.remove(pid_file)
-            except Exception:
+            except OSError:
                 pass
             print("Swarmbot daemon PID 文件无效，已清理。")
             return
@@ -631,27 +650,42 @@ def cmd_daemon(args: argparse.Namespace) -> None:
             pass
 
 
-def main() -> None:
-    # Use parse_known_args so we can grab extra args for passthrough commands
-    parser = argparse.ArgumentParser(description="Swarmbot CLI")
-    subparsers = parser.add_subparsers(dest="command", required=True)
+def _build_onboard(subparsers) -> None:
+    p = subparsers.add_parser("onboard", help="初始化配置和工作区")
+    p.set_defaults(func=lambda args: cmd_onboard())
 
-    subparsers.add_parser("onboard", help="初始化配置和工作区")
 
-    subparsers.add_parser("run", help="与 Swarmbot 进行连续对话（本地调试）")
+def _build_run(subparsers) -> None:
+    p = subparsers.add_parser("run", help="与 Swarmbot 进行连续对话（本地调试）")
+    p.set_defaults(func=lambda args: cmd_run())
 
-    # Gateway passthrough
-    subparsers.add_parser("gateway", help="启动 Swarmbot Gateway")
-    
+
+def _build_gateway(subparsers) -> None:
+    p = subparsers.add_parser("gateway", help="启动 Swarmbot Gateway")
+    p.set_defaults(func=lambda args: cmd_gateway())
+
+
+def _build_heartbeat(subparsers) -> None:
     heartbeat_parser = subparsers.add_parser("heartbeat", help="管理 Swarmbot 的 heartbeat")
+    heartbeat_parser.set_defaults(func=cmd_heartbeat)
     heartbeat_sub = heartbeat_parser.add_subparsers(dest="action", required=True)
     heartbeat_sub.add_parser("status", help="查看 heartbeat 状态")
     heartbeat_sub.add_parser("trigger", help="立即执行一次 heartbeat 检查")
 
-    subparsers.add_parser("tool", help="查看和使用 Swarmbot 暴露的工具（简化模式）")
-    subparsers.add_parser("channels", help="管理 Swarmbot 的消息通道配置")
-    
+
+def _build_tool(subparsers) -> None:
+    p = subparsers.add_parser("tool", help="查看和使用 Swarmbot 暴露的工具（简化模式）")
+    p.set_defaults(func=lambda args: cmd_tool())
+
+
+def _build_channels(subparsers) -> None:
+    p = subparsers.add_parser("channels", help="管理 Swarmbot 的消息通道配置")
+    p.set_defaults(func=lambda args: cmd_channels(args, sys.argv[2:]))
+
+
+def _build_cron(subparsers) -> None:
     cron_parser = subparsers.add_parser("cron", help="管理 Swarmbot 的定时任务")
+    cron_parser.set_defaults(func=cmd_cron)
     cron_sub = cron_parser.add_subparsers(dest="action", required=True)
     cron_sub.add_parser("list", help="列出所有定时任务")
     cron_add = cron_sub.add_parser("add", help="添加一个新的定时任务")
@@ -667,11 +701,19 @@ def main() -> None:
     cron_enable.add_argument("--id", required=True, help="任务 ID")
     cron_disable = cron_sub.add_parser("disable", help="禁用定时任务")
     cron_disable.add_argument("--id", required=True, help="任务 ID")
-    
-    subparsers.add_parser("agent", help="保留占位符（原 nanobot agent 透传已禁用）")
 
-    subparsers.add_parser("status", help="查看当前 Swarmbot 状态")
 
+def _build_agent(subparsers) -> None:
+    p = subparsers.add_parser("agent", help="保留占位符（原 nanobot agent 透传已禁用）")
+    p.set_defaults(func=lambda args: print("直接与底层 nanobot agent 对话的功能已禁用。"))
+
+
+def _build_status(subparsers) -> None:
+    p = subparsers.add_parser("status", help="查看当前 Swarmbot 状态")
+    p.set_defaults(func=lambda args: cmd_status())
+
+
+def _build_provider(subparsers) -> None:
     provider_parser = subparsers.add_parser("provider", help="管理模型提供方")
     provider_sub = provider_parser.add_subparsers(dest="action", required=True)
     provider_add = provider_sub.add_parser("add", help="新增/覆盖一个模型提供方（仅保留一个）")
@@ -684,28 +726,19 @@ def main() -> None:
         default=4096,
         help="最大生成 token 数",
     )
-    provider_sub.add_parser("delete", help="删除当前 provider 配置，恢复默认")
+    provider_add.set_defaults(func=cmd_provider_add)
+    provider_delete = provider_sub.add_parser("delete", help="删除当前 provider 配置，恢复默认")
+    provider_delete.set_defaults(func=lambda args: cmd_provider_delete())
+
 
+def _build_config(subparsers) -> None:
     config_parser = subparsers.add_parser("config", help="配置和查看 Swarm 工作模式")
+    config_parser.set_defaults(func=cmd_config)
     config_parser.add_argument("--max-agents", type=int, help="Swarm 中的 agent 最大数量")
     config_parser.add_argument(
         "--architecture",
         type=str,
-        choices=[
-            "auto",
-            "sequential",
-            "concurrent",
-            "agent_rearrange",
-            "graph",
-            "mixture",
-            "group_chat",
-            "forest",
-            "hierarchical",
-            "heavy",
-            "swarm_router",
-            "long_horizon",
-            "state_machine",
-        ],
+        choices=_ARCHITECTURES,
         help="架构类型，对应 swarms Multi-Agent Architectures（默认 auto = AutoSwarmBuilder）",
     )
     config_parser.add_argument("--max-turns", type=int, help="对话最大轮数（0 为不限制）")
@@ -715,55 +748,86 @@ def main() -> None:
         help="是否启用 AutoSwarmBuilder",
     )
 
-    subparsers.add_parser("skill", help="查看当前可用的技能（内部通过 ToolAdapter 实现）")
 
+def _build_skill(subparsers) -> None:
+    p = subparsers.add_parser("skill", help="查看当前可用的技能（内部通过 ToolAdapter 实现）")
+    p.set_defaults(func=lambda args: print("技能管理请通过对话中的 skill_summary / skill_load 工具完成。"))
+
+
+def _build_daemon(subparsers) -> None:
     daemon_parser = subparsers.add_parser("daemon", help="管理 Swarmbot 守护进程")
+    daemon_parser.set_defaults(func=cmd_daemon)
     daemon_sub = daemon_parser.add_subparsers(dest="action", required=True)
     daemon_sub.add_parser("start", help="启动守护进程")
     daemon_sub.add_parser("shutdown", help="关闭守护进程")
 
+
+def _build_autonomous(subparsers) -> None:
     autonomous_parser = subparsers.add_parser("autonomous", help="启动 Autonomous Engine")
+    autonomous_parser.set_defaults(func=cmd_autonomous)
     autonomous_sub = autonomous_parser.add_subparsers(dest="action", required=True)
     autonomous_sub.add_parser("start", help="启动 Autonomous Engine")
     autonomous_sub.add_parser("stop", help="停止 Autonomous Engine")
 
-    subparsers.add_parser("update", help="更新 Swarmbot 核心代码（保留配置）")
 
+def _build_update(subparsers) -> None:
+    p = subparsers.add_parser("update", help="更新 Swarmbot 核心代码（保留配置）")
+    p.set_defaults(func=lambda args: cmd_update())
+
+
+# Insertion order is the order commands are listed in `swarmbot --help`.
+_SUBPARSER_BUILDERS = {
+    "onboard": _build_onboard,
+    "run": _build_run,
+    "gateway": _build_gateway,
+    "heartbeat": _build_heartbeat,
+    "tool": _build_tool,
+    "channels": _build_channels,
+    "cron": _build_cron,
+    "agent": _build_agent,
+    "status": _build_status,
+    "provider": _build_provider,
+    "config": _build_config,
+    "skill": _build_skill,
+    "daemon": _build_daemon,
+    "autonomous": _build_autonomous,
+    "update": _build_update,
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the subcommand named in argv, or None if there isn't a known one.
+
+    Only the first positional token counts, and a top-level -h/--help before
+    it means the full command list is wanted.
+    """
+    for arg in argv[1:]:
+        if arg in ("-h", "--help"):
+            return None
+        if not arg.startswith("-"):
+            return arg if arg in _SUBPARSER_BUILDERS else None
+    return None
+
+
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Swarmbot CLI")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    # Only build the requested command's parser; unknown input (including
+    # --help) gets the full parser so usage and errors stay complete.
+    if command in _SUBPARSER_BUILDERS:
+        _SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for build in _SUBPARSER_BUILDERS.values():
+            build(subparsers)
+    return parser
+
+
+def main() -> None:
+    # Use parse_known_args so we can grab extra args for passthrough commands
+    parser = _build_parser(_sniff_subcommand(sys.argv))
     args, _ = parser.parse_known_args()
+    args.func(args)
 
-    if args.command == "onboard":
-        cmd_onboard()
-    elif args.command == "update":
-        cmd_update()
-    elif args.command == "run":
-        cmd_run()
-    elif args.command == "gateway":
-        cmd_gateway()
-    elif args.command == "heartbeat":
-        cmd_heartbeat(args)
-    elif args.command == "tool":
-        cmd_tool()
-    elif args.command == "channels":
-        cmd_channels(args, sys.argv[2:])
-    elif args.command == "cron":
-        cmd_cron(args)
-    elif args.command == "agent":
-        print("直接与底层 nanobot agent 对话的功能已禁用。")
-    elif args.command == "status":
-        cmd_status()
-    elif args.command == "provider":
-        if args.action == "add":
-            cmd_provider_add(args)
-        elif args.action == "delete":
-            cmd_provider_delete()
-    elif args.command == "config":
-        cmd_config(args)
-    elif args.command == "skill":
-        print("技能管理请通过对话中的 skill_summary / skill_load 工具完成。")
-    elif args.command == "daemon":
-        cmd_daemon(args)
-    elif args.command == "autonomous":
-        cmd_autonomous(args)
 
 if __name__ == "__main__":
     main()
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
-import json
+import hashlib
 import os
-from dataclasses import dataclass, asdict, field
+import tempfile
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from .json_compat import dumpb as json_dumpb, loads as json_loads
+
 CONFIG_HOME = os.path.expanduser("~/.swarmbot")
 CONFIG_PATH = os.path.join(CONFIG_HOME, "config.json")
 WORKSPACE_PATH = os.path.join(CONFIG_HOME, "workspace")
 BOOT_CONFIG_PATH = os.path.join(CONFIG_HOME, "boot")
 
+# Immutable defaults; factories below copy them into fresh lists per instance.
+_DEFAULT_DENY_PATTERNS = ("rm -rf /", "shutdown", "reboot", ":(){:|:&};:", "mkfs", "dd if=")
+_DEFAULT_LOCKED_BUNDLES = (
+    "core.memory_foundation",
+    "core.boot_optimizer",
+    "core.system_hygiene",
+    "core.bundle_governor",
+)
+_DEFAULT_SWARM_ARCHITECTURES = ("auto", "tree", "mesh", "pipeline")
+
 
-@dataclass
+@dataclass(slots=True)
 class ProviderConfig:
     name: str = "custom"
     base_url: str = ""
@@ -21,7 +34,7 @@ class ProviderConfig:
     temperature: float = 0.6
 
 
-@dataclass
+@dataclass(slots=True)
 class SwarmSettings:
     max_agents: int = 4 # Maximum number of agents in the swarm
     # Default roles list is just a suggestion or pool; if dynamic allocation is used, this might be ignored or extended
@@ -33,20 +46,20 @@ class SwarmSettings:
     display_mode: str = "simple"  # simple or log
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolConfig:
     fs: Dict[str, Any] = field(default_factory=lambda: {"allow_read": [], "allow_write": []})
     shell: Dict[str, Any] = field(default_factory=lambda: {"allow_commands": [], "deny_commands": []}) # Unrestricted by default
     exec: Dict[str, Any] = field(
         default_factory=lambda: {
             "approval_mode": "deny_dangerous",
-            "deny_patterns": ["rm -rf /", "shutdown", "reboot", ":(){:|:&};:", "mkfs", "dd if="],
+            "deny_patterns": list(_DEFAULT_DENY_PATTERNS),
             "default_timeout_seconds": 30,
             "max_concurrent_processes": 8,
         }
     )
 
-@dataclass
+@dataclass(slots=True)
 class ChannelConfig:
     enabled: bool = False
     app_id: str = ""
@@ -57,16 +70,18 @@ class ChannelConfig:
     config: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class DaemonConfig:
     manage_gateway: bool = True
     manage_autonomous: bool = True
     backup_interval_seconds: int = 60
+    # Newest local backups to keep; older ones are pruned (0 keeps all).
+    backup_keep_last: int = 0
     health_check_interval_seconds: int = 3600
     gateway_restart_delay_seconds: int = 10
     autonomous_restart_delay_seconds: int = 10
 
-@dataclass
+@dataclass(slots=True)
 class AutonomousConfig:
     enabled: bool = True
     tick_seconds: int = 30
@@ -74,14 +89,7 @@ class AutonomousConfig:
     # Independent provider for autonomous mode
     provider: Optional[ProviderConfig] = field(default_factory=lambda: ProviderConfig(name="autonomous", max_tokens=8192))
     model_routing: Dict[str, Any] = field(default_factory=dict)
-    default_locked_bundles: List[str] = field(
-        default_factory=lambda: [
-            "core.memory_foundation",
-            "core.boot_optimizer",
-            "core.system_hygiene",
-            "core.bundle_governor",
-        ]
-    )
+    default_locked_bundles: List[str] = field(default_factory=lambda: list(_DEFAULT_LOCKED_BUNDLES))
     queues: Dict[str, Any] = field(
         default_factory=lambda: {
             "monitor_queue_size": 1000,
@@ -93,7 +101,7 @@ class AutonomousConfig:
         default_factory=lambda: {
             "worker_min": 1,
             "worker_max": 10,
-            "architectures": ["auto", "tree", "mesh", "pipeline"],
+            "architectures": list(_DEFAULT_SWARM_ARCHITECTURES),
             "require_tasklist_before_dispatch": True,
             "role_selection_mode": "self_select_by_tasklist",
         }
@@ -114,7 +122,7 @@ class AutonomousConfig:
         }
     )
 
-@dataclass
+@dataclass(slots=True)
 class SwarmbotConfig:
     providers: List[ProviderConfig] = field(default_factory=lambda: [
         ProviderConfig(name="primary"),
@@ -128,42 +136,162 @@ class SwarmbotConfig:
     autonomous: AutonomousConfig = field(default_factory=AutonomousConfig)
     # No more hardcoded paths here, rely on constants
 
+
+# Field names per section, so the loader can pick known keys with a set
+# intersection instead of probing each key with hasattr().
+_PROVIDER_FIELDS = frozenset(ProviderConfig.__dataclass_fields__)
+_SWARM_FIELDS = frozenset(SwarmSettings.__dataclass_fields__)
+_DAEMON_FIELDS = frozenset(DaemonConfig.__dataclass_fields__)
+# Top-level channel keys; everything else in a channel entry lands in .config.
+_CHANNEL_FIELDS = frozenset(ChannelConfig.__dataclass_fields__) - {"config"}
+# autonomous.provider is rebuilt as a ProviderConfig separately.
+_AUTONOMOUS_FIELDS = frozenset(AutonomousConfig.__dataclass_fields__) - {"provider"}
+
+# Primary provider field -> environment variable exported on load.
+_ENV_MAP = (
+    ("base_url", "OPENAI_API_BASE"),
+    ("api_key", "OPENAI_API_KEY"),
+    ("model", "LITELLM_MODEL"),
+)
+
+
+def _flat(dc: Any) -> Dict[str, Any]:
+    """Shallow dataclass -> dict for serialization (asdict() deep-copies every value)."""
+    return {f: getattr(dc, f) for f in dc.__dataclass_fields__}
+
+
+# Set once ensure_dirs() has created the directories in this process.
+_DIRS_READY = False
+
+
 def ensure_dirs() -> None:
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
     # Ensure config and workspace exist
     os.makedirs(CONFIG_HOME, exist_ok=True)
     os.makedirs(WORKSPACE_PATH, exist_ok=True)
     # Ensure boot config dir exists
     os.makedirs(BOOT_CONFIG_PATH, exist_ok=True)
+    _DIRS_READY = True
+
+
+def reset_dirs_ready() -> None:
+    """Make the next ensure_dirs() re-create the directories (e.g. after a wipe)."""
+    global _DIRS_READY
+    _DIRS_READY = False
+
+# ((st_mtime_ns, st_size) of CONFIG_PATH, parsed config) for this process. The
+# stat check keeps long-running processes (daemon, gateway) in sync with edits
+# made by other processes; save_config re-primes the entry.
+_config_cache: Optional[tuple[tuple[int, int], SwarmbotConfig]] = None
+
+
+def _config_stat_key() -> Optional[tuple[int, int]]:
+    try:
+        st = os.stat(CONFIG_PATH)
+    except OSError:
+        return None
+    # Size catches rewrites that land within the filesystem's mtime granularity.
+    return (st.st_mtime_ns, st.st_size)
+
+
+# Mode a newly created config.json gets. The umask can only be read by setting
+# it, so do that once here rather than racing other threads on every save.
+_umask = os.umask(0o022)
+os.umask(_umask)
+_NEW_FILE_MODE = 0o666 & ~_umask
+del _umask
+
+# (stat key, blake2b digest) of config.json right after this process last
+# wrote it; lets save_config() skip rewriting identical content.
+_last_write: Optional[tuple[tuple[int, int], bytes]] = None
+
+
+def invalidate_config_cache() -> None:
+    """Force the next load_config() to re-read config.json."""
+    global _config_cache
+    _config_cache = None
+
 
 def load_config() -> SwarmbotConfig:
+    """Return the parsed config, re-reading the file only when it changed.
+
+    The returned object is shared by every caller in this process. Mutate it
+    only as part of a load -> modify -> save_config() round-trip; take a
+    copy.deepcopy() for local, unsaved overrides.
+    """
+    global _config_cache
+    key = _config_stat_key()
+    if key is not None and _config_cache is not None and _config_cache[0] == key:
+        cfg = _config_cache[1]
+    else:
+        cfg = _read_config()
+        key = _config_stat_key()
+        _config_cache = (key, cfg) if key is not None else None
+    # Cache hits export too: save_config() primes the cache with what it wrote.
+    _export_provider_env(cfg)
+    return cfg
+
+
+def _export_provider_env(cfg: SwarmbotConfig) -> None:
+    """Sync the primary provider into the OPENAI_*/LITELLM_* environment variables."""
+    if not cfg.providers:
+        return
+    primary = cfg.providers[0]
+    environ = os.environ
+    for attr, env_key in _ENV_MAP:
+        value = getattr(primary, attr)
+        # Skip putenv() when the value is already in place.
+        if value and environ.get(env_key) != value:
+            environ[env_key] = value
+
+
+def _read_config_bytes() -> bytes:
+    # One os.read() sized from fstat(), without the buffered-IO layers of open().
+    fd = os.open(CONFIG_PATH, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    try:
+        size = os.fstat(fd).st_size
+        # Ask for one extra byte: a short read means EOF, a full one means the
+        # file grew after fstat() and the rest must be drained.
+        buf = os.read(fd, size + 1)
+        if len(buf) <= size:
+            return buf
+        chunks = [buf]
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def _read_config() -> SwarmbotConfig:
     ensure_dirs()
-    if not os.path.exists(CONFIG_PATH):
+    try:
+        raw = _read_config_bytes()
+    except FileNotFoundError:
         # Create default config with 2 providers (from default_factory)
         cfg = SwarmbotConfig()
         save_config(cfg)
         return cfg
     
     try:
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json_loads(raw)
             
         cfg = SwarmbotConfig()
         
         # 1. Load Providers (Priority: providers list > provider object)
         if "providers" in data and isinstance(data["providers"], list) and len(data["providers"]) > 0:
-            cfg.providers = []
-            for p_data in data["providers"]:
-                p = ProviderConfig()
-                for k, v in p_data.items():
-                    if hasattr(p, k):
-                        setattr(p, k, v)
-                cfg.providers.append(p)
+            cfg.providers = [
+                ProviderConfig(**{k: p_data[k] for k in _PROVIDER_FIELDS & p_data.keys()})
+                for p_data in data["providers"]
+            ]
         elif "provider" in data:
             # Migration: Use existing provider as primary, add backup template
-            p = ProviderConfig()
-            for k, v in data["provider"].items():
-                if hasattr(p, k):
-                    setattr(p, k, v)
+            p_data = data["provider"]
+            p = ProviderConfig(**{k: p_data[k] for k in _PROVIDER_FIELDS & p_data.keys()})
             p.name = "primary"
             # Keep old provider + add backup template
             cfg.providers = [p, ProviderConfig(name="backup")]
@@ -171,11 +299,11 @@ def load_config() -> SwarmbotConfig:
             
         # 2. Load Swarm Settings
         if "swarm" in data:
-            for k, v in data["swarm"].items():
-                if k == "agent_count": # Migration: agent_count -> max_agents
-                    cfg.swarm.max_agents = v
-                elif hasattr(cfg.swarm, k):
-                    setattr(cfg.swarm, k, v)
+            s_data = data["swarm"]
+            if "agent_count" in s_data: # Migration: agent_count -> max_agents
+                cfg.swarm.max_agents = s_data["agent_count"]
+            for k in _SWARM_FIELDS & s_data.keys():
+                setattr(cfg.swarm, k, s_data[k])
                     
         # 3. Load Tools
         if "tools" in data:
@@ -189,31 +317,24 @@ def load_config() -> SwarmbotConfig:
             cfg.channels = {}
             for ch_name, ch_data in data["channels"].items():
                 ch_cfg = ChannelConfig()
-                # Handle simple dict or structured
-                conf_dict = ch_data.get("config", {}) if "config" in ch_data else ch_data
-                
-                if "enabled" in ch_data: ch_cfg.enabled = ch_data["enabled"]
-                if "app_id" in ch_data: ch_cfg.app_id = ch_data["app_id"]
-                if "app_secret" in ch_data: ch_cfg.app_secret = ch_data["app_secret"]
-                if "encrypt_key" in ch_data: ch_cfg.encrypt_key = ch_data["encrypt_key"]
-                if "verification_token" in ch_data: ch_cfg.verification_token = ch_data["verification_token"]
-                if "token" in ch_data: ch_cfg.token = ch_data["token"]
+                for k in _CHANNEL_FIELDS & ch_data.keys():
+                    setattr(ch_cfg, k, ch_data[k])
                 
-                # Copy other keys to config dict
-                for k, v in ch_data.items():
-                    if k not in ["enabled", "app_id", "app_secret", "encrypt_key", "verification_token", "token", "config"]:
-                        ch_cfg.config[k] = v
-                # Merge nested config if present
-                if "config" in ch_data and isinstance(ch_data["config"], dict):
-                    ch_cfg.config.update(ch_data["config"])
+                # Copy other keys to config dict, then merge nested config if present
+                ch_cfg.config = {
+                    k: v for k, v in ch_data.items() if k not in _CHANNEL_FIELDS and k != "config"
+                }
+                nested = ch_data.get("config")
+                if isinstance(nested, dict):
+                    ch_cfg.config.update(nested)
                     
                 cfg.channels[ch_name] = ch_cfg
 
         # 5. Load Daemon
         if "daemon" in data:
-            for k, v in data["daemon"].items():
-                if hasattr(cfg.daemon, k):
-                    setattr(cfg.daemon, k, v)
+            d_data = data["daemon"]
+            for k in _DAEMON_FIELDS & d_data.keys():
+                setattr(cfg.daemon, k, d_data[k])
 
         # 6. Load Autonomous
         if "autonomous" in data:
@@ -221,23 +342,12 @@ def load_config() -> SwarmbotConfig:
             # Handle provider specifically to ensure it's a ProviderConfig object
             if "provider" in auto_data and isinstance(auto_data["provider"], dict):
                 p_data = auto_data["provider"]
-                p = ProviderConfig()
-                for k, v in p_data.items():
-                    if hasattr(p, k):
-                        setattr(p, k, v)
-                cfg.autonomous.provider = p
+                cfg.autonomous.provider = ProviderConfig(
+                    **{k: p_data[k] for k in _PROVIDER_FIELDS & p_data.keys()}
+                )
             
-            for k, v in auto_data.items():
-                if k == "provider": continue
-                if hasattr(cfg.autonomous, k):
-                    setattr(cfg.autonomous, k, v)
-
-        # Sync environment variables from primary provider
-        if cfg.providers:
-            primary = cfg.providers[0]
-            if primary.base_url: os.environ["OPENAI_API_BASE"] = primary.base_url
-            if primary.api_key: os.environ["OPENAI_API_KEY"] = primary.api_key
-            if primary.model: os.environ["LITELLM_MODEL"] = primary.model
+            for k in _AUTONOMOUS_FIELDS & auto_data.keys():
+                setattr(cfg.autonomous, k, auto_data[k])
 
         return cfg
 
@@ -248,6 +358,8 @@ def load_config() -> SwarmbotConfig:
 
 
 def save_config(cfg: SwarmbotConfig) -> None:
+    global _config_cache, _last_write
+    invalidate_config_cache()
     ensure_dirs()
     
     # Prepare channels dict
@@ -267,16 +379,71 @@ def save_config(cfg: SwarmbotConfig) -> None:
         channels_dict[name] = c_dict
 
     # Prepare providers list
-    providers_list = [asdict(p) for p in cfg.providers]
+    providers_list = [_flat(p) for p in cfg.providers]
+
+    # autonomous.provider is the only nested dataclass; flatten it explicitly.
+    autonomous_dict = _flat(cfg.autonomous)
+    if cfg.autonomous.provider is not None:
+        autonomous_dict["provider"] = _flat(cfg.autonomous.provider)
 
     data = {
         "providers": providers_list,
-        "swarm": asdict(cfg.swarm),
-        "tools": asdict(cfg.tools),
+        "swarm": _flat(cfg.swarm),
+        "tools": _flat(cfg.tools),
         "channels": channels_dict,
-        "daemon": asdict(cfg.daemon),
-        "autonomous": asdict(cfg.autonomous),
+        "daemon": _flat(cfg.daemon),
+        "autonomous": autonomous_dict,
     }
 
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Serialize up front so the file is written with a single write() call.
+    payload = json_dumpb(data, indent=True)
+
+    # Skip the write when the same bytes are already on disk and the file has
+    # not been touched since we wrote them (the daemon saves on every start).
+    digest = hashlib.blake2b(payload, digest_size=8).digest()
+    key = _config_stat_key()
+    if key is not None and _last_write == (key, digest):
+        _config_cache = (key, cfg)
+        return
+
+    # Write to a uniquely named sibling temp file and swap it in, so readers
+    # never observe a half-written config.json and concurrent savers (CLI,
+    # gateway, daemon) never write into each other's temp file.
+    try:
+        fd, tmp = tempfile.mkstemp(prefix=".config.", suffix=".tmp", dir=CONFIG_HOME)
+    except FileNotFoundError:
+        # CONFIG_HOME was removed after ensure_dirs() last ran; recreate it.
+        reset_dirs_ready()
+        ensure_dirs()
+        fd, tmp = tempfile.mkstemp(prefix=".config.", suffix=".tmp", dir=CONFIG_HOME)
+    try:
+        # mkstemp creates 0600; keep the mode of an existing config.json, and
+        # give a new one the mode open() would have (0666 minus the umask).
+        try:
+            mode = os.stat(CONFIG_PATH).st_mode & 0o777
+        except OSError:
+            mode = _NEW_FILE_MODE
+        try:
+            os.fchmod(fd, mode)
+        except (OSError, AttributeError):  # no fchmod (Windows)
+            pass
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            if os.environ.get("SWARMBOT_CONFIG_FSYNC"):
+                # Opt-in durability; fdatasync skips the metadata flush fsync does.
+                f.flush()
+                getattr(os, "fdatasync", os.fsync)(f.fileno())
+        os.replace(tmp, CONFIG_PATH)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+    # What was just written is exactly cfg, so the next load_config() in this
+    # process can skip re-reading it.
+    key = _config_stat_key()
+    if key is not None:
+        _config_cache = (key, cfg)
+        _last_write = (key, digest)
@@ -1,16 +1,106 @@
 from __future__ import annotations
 
+import datetime
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from ..config_manager import BOOT_CONFIG_PATH
+from ..json_compat import JSONDecodeError, loads as json_loads
 from ..llm_client import OpenAICompatibleClient
 from ..memory.base import MemoryStore
 from ..memory.hot_memory import HotMemory
 from ..memory.session_memory import SessionMemory
 from ..tools.adapter import ToolAdapter
-import json
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Upper bound on threads used to run one round of tool calls in parallel.
+MAX_TOOL_WORKERS = 8
+
+# Resolved once at import; expanduser() does a passwd lookup on every call.
+OVERTHINKING_SOUL_PATH = os.path.join(BOOT_CONFIG_PATH, "OVERTHINKING.md")
+SOUL_PATH = os.path.join(BOOT_CONFIG_PATH, "SOUL.md")
+_SOUL_PATHS = (SOUL_PATH, "soul.md")
+_OVERTHINKING_SOUL_PATHS = (OVERTHINKING_SOUL_PATH,) + _SOUL_PATHS
+
+# Roles that speak for the swarm and therefore get the full Soul.
+_MASTER_ROLES = frozenset({"planner", "judge", "master", "consensus_moderator"})
+_FALLBACK_SOUL = (
+    "You are Swarmbot, a collective AI intelligence designed to solve complex problems through "
+    "multi-agent collaboration. You are helpful, precise, and objective."
+)
+_SUB_AGENT_SOUL = (
+    "You are a specialized functional node within the Swarmbot collective. "
+    "Your specific role is: {role}."
+)
+_MASTER_PERSONA_TAIL = (
+    "Act as a seamless part of the swarm. "
+    "You are the primary interface to the user. Speak with the voice defined in your Soul."
+)
+_SUB_AGENT_PERSONA_TAIL = (
+    "Act as a seamless part of the swarm. "
+    "Do not introduce yourself or deviate from your specific task. Output only what is required for the collective."
+)
+# System prompts longer than this are cut before being sent.
+_MAX_SYSTEM_CHARS = 6000
+
+# Shared tail of every agent's system prompt.
+_SYSTEM_INSTRUCTIONS = (
+    "【记忆与白板分层】\n"
+    "1. **Whiteboard (L1)**: 会话级临时白板。用于当前 Loop 的推理状态、临时变量、Step 拆解。任务结束后会被清除。使用 `whiteboard_update`。\n"
+    "   - 适用：当前任务的 intermediate_results, execution_plan。\n"
+    "2. **Hot Memory (L2)**: 短期持久记忆。用于记录跨会话的 Todo List、近期计划、重要备忘。使用 `hot_memory_update`。\n"
+    "   - 适用：用户明确要求的待办事项（如 'Add to todo'）、跨天计划。\n"
+    "   - 注意：这是全局共享的，请谨慎覆盖，通常应追加或更新特定章节。\n\n"
+    "【Programmatic Tool Calling】\n"
+    "For complex tasks involving data processing, multi-step workflows, or when outputting large data is inefficient, "
+    "use the 'python_exec' tool. This allows you to write Python code to orchestrate other tools "
+    "(e.g., file_read, web_search) and process their output locally. "
+    "Instead of making multiple individual tool calls, write a single script to handle the logic and return only the final result.\n\n"
+    "【工具与 Skill 使用】\n"
+    "调用工具前先查看 Whiteboard 的 current_task_context 和 Hot Memory 的 L2 Context：若已存在 fact_checked=true 的可靠结论，应优先复用；"
+    "若只有 fact_checked=false 的假设，需要通过工具补充或复核后再做判断。"
+    "使用技能时，优先调用 'skill_summary' 获取列表，仅在确实需要时再用 'skill_load' 加载单个技能详情，避免一次性加载全部技能。\n\n"
+    "【系统能力与运维】\n"
+    "系统能力（daemon、heartbeat、cron、skills 等）通过 system_capabilities 提供，你可以结合 'file_read'、'file_write' 和 'shell_exec' 分析或调整状态，"
+    "但涉及任务调度、心跳、定时任务变更时，应在回答中明确提示风险并要求用户确认。\n\n"
+    "【输出与检索规范】\n"
+    "输出语言必须与用户输入保持一致。回答涉及最新事件或动态数据时，应优先使用 'web_search' 或相关工具，并在确认信息后再给出结论。"
+)
+
+# path -> ((st_mtime_ns, st_size), content), shared by every agent in the process.
+_SOUL_CACHE: Dict[str, tuple[tuple[int, int], str]] = {}
+
+
+def _load_soul(paths: tuple[str, ...]) -> str:
+    """Return the first readable soul file in ``paths``, or "" if none.
+
+    Costs one stat() per probed path; the file is only re-read when its
+    mtime or size changes.
+    """
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _SOUL_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError):
+            continue
+        _SOUL_CACHE[path] = (stamp, content)
+        return content
+    return ""
+
+@dataclass(slots=True)
 class AgentContext:
     agent_id: str
     role: str = "assistant"
@@ -47,6 +137,13 @@ class CoreAgent:
         if session_memory:
             self._tool_adapter.session_memory = session_memory
 
+        # ((agent_id, role, soul file text), soul_content, persona_tail); see _persona().
+        self._persona_cache: Optional[tuple[tuple[str, str, str], str, str]] = None
+        # (skills dict, its size, adapter defs map, filtered tools); see _skill_tools().
+        self._tools_cache: Optional[tuple[Dict[str, Any], int, Dict[str, Any], List[Dict[str, Any]]]] = None
+        # (skills dict, its size, "You possess the following skills: ..." text).
+        self._skills_desc_cache: Optional[tuple[Dict[str, Any], int, str]] = None
+
     def _message_to_dict(self, message: Any) -> Dict[str, Any]:
         role = getattr(message, "role", "assistant")
         content = getattr(message, "content", "")
@@ -80,57 +177,65 @@ class CoreAgent:
             text = text[idx + len("</think>") :]
         return text.strip() or (content or "")
 
-    def _build_messages(self, user_input: str) -> List[Dict[str, Any]]:
-        history = self.memory.get_context(self.ctx.agent_id, limit=8, query=user_input)
-        messages: List[Dict[str, Any]] = []
-        
-        # 1. System Prompt (Role / Soul)
-        import datetime
-        import time
-        current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        timezone = time.strftime("%z")
-        weekday = datetime.datetime.now().strftime("%A")
-        
+    def reload_soul(self) -> None:
+        """Drop the cached persona and soul text so the next turn re-reads them."""
+        self._persona_cache = None
+        _SOUL_CACHE.clear()
+
+    def refresh_tools(self) -> None:
+        """Drop the cached tool list and skills text after editing ctx.skills in place.
+
+        Assigning a new skills dict is picked up automatically.
+        """
+        self._tools_cache = None
+        self._skills_desc_cache = None
+
+    def _persona(self) -> tuple[str, str]:
+        """Return (soul_content, persona_tail) for the current agent_id/role.
+
+        Both only depend on agent_id, role and the soul files, so they are
+        built once and reused across turns; a role change or an edited soul
+        file rebuilds them.
+        """
         # Soul Loading Logic
         # Only the 'Master' agent (Planner/Judge) or if specifically configured should load the full Soul.
         # Sub-agents should have a functional persona.
         
         is_overthinking = self.ctx.agent_id == "overthinker"
-        is_master = self.ctx.role in ["planner", "judge", "master", "consensus_moderator"] or is_overthinking
+        is_master = self.ctx.role in _MASTER_ROLES or is_overthinking
         soul_content = ""
+        if is_master:
+            soul_content = _load_soul(_OVERTHINKING_SOUL_PATHS if is_overthinking else _SOUL_PATHS)
+
+        key = (self.ctx.agent_id, self.ctx.role, soul_content)
+        cached = self._persona_cache
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
         
         if is_master:
-            try:
-                import os
-                soul_paths = []
-                if is_overthinking:
-                    soul_paths.append(os.path.expanduser("~/.swarmbot/boot/OVERTHINKING.md"))
-                soul_paths.extend(
-                    [
-                        os.path.expanduser("~/.swarmbot/boot/SOUL.md"),
-                        "soul.md",
-                    ]
-                )
-                for p in soul_paths:
-                    if os.path.exists(p):
-                        with open(p, "r", encoding="utf-8") as f:
-                            soul_content = f.read()
-                        break
-            except:
-                pass
-            
             # Fallback if no soul file
-            if not soul_content:
-                soul_content = (
-                    "You are Swarmbot, a collective AI intelligence designed to solve complex problems through "
-                    "multi-agent collaboration. You are helpful, precise, and objective."
-                )
+            soul_content = soul_content or _FALLBACK_SOUL
+            persona_tail = _MASTER_PERSONA_TAIL
         else:
             # Functional Role Persona for Sub-Agents
-            soul_content = (
-                f"You are a specialized functional node within the Swarmbot collective. "
-                f"Your specific role is: {self.ctx.role}."
-            )
+            soul_content = _SUB_AGENT_SOUL.format(role=self.ctx.role)
+            persona_tail = _SUB_AGENT_PERSONA_TAIL
+
+        self._persona_cache = (key, soul_content, persona_tail)
+        return soul_content, persona_tail
+
+    def _build_messages(self, user_input: str) -> List[Dict[str, Any]]:
+        history = self.memory.get_context(self.ctx.agent_id, limit=8, query=user_input)
+        messages: List[Dict[str, Any]] = []
+        
+        # 1. System Prompt (Role / Soul)
+        # One clock read for time, weekday and UTC offset (DST-aware).
+        now = datetime.datetime.now().astimezone()
+        current_time = now.strftime("%Y-%m-%d %H:%M:%S")
+        timezone = now.strftime("%z")
+        weekday = now.strftime("%A")
+        
+        soul_content, persona_tail = self._persona()
 
         # UNIFIED PERSONA ENFORCEMENT
         role_desc = (
@@ -138,43 +243,20 @@ class CoreAgent:
             f"Current Context:\n"
             f"- Time: {current_time} ({timezone})\n"
             f"- Weekday: {weekday}\n"
-            "Act as a seamless part of the swarm. "
+            f"{persona_tail}"
         )
-        
-        if is_master:
-            role_desc += "You are the primary interface to the user. Speak with the voice defined in your Soul."
-        else:
-            role_desc += "Do not introduce yourself or deviate from your specific task. Output only what is required for the collective."
 
-        if self.ctx.skills:
-            role_desc += f" You possess the following skills: {', '.join(self.ctx.skills.keys())}. "
+        skills = self.ctx.skills
+        if skills:
+            cached = self._skills_desc_cache
+            if cached is None or cached[0] is not skills or cached[1] != len(skills):
+                desc = f" You possess the following skills: {', '.join(skills.keys())}. "
+                cached = self._skills_desc_cache = (skills, len(skills), desc)
+            role_desc += cached[2]
         
-        system_instructions = (
-            "【记忆与白板分层】\n"
-            "1. **Whiteboard (L1)**: 会话级临时白板。用于当前 Loop 的推理状态、临时变量、Step 拆解。任务结束后会被清除。使用 `whiteboard_update`。\n"
-            "   - 适用：当前任务的 intermediate_results, execution_plan。\n"
-            "2. **Hot Memory (L2)**: 短期持久记忆。用于记录跨会话的 Todo List、近期计划、重要备忘。使用 `hot_memory_update`。\n"
-            "   - 适用：用户明确要求的待办事项（如 'Add to todo'）、跨天计划。\n"
-            "   - 注意：这是全局共享的，请谨慎覆盖，通常应追加或更新特定章节。\n\n"
-            "【Programmatic Tool Calling】\n"
-            "For complex tasks involving data processing, multi-step workflows, or when outputting large data is inefficient, "
-            "use the 'python_exec' tool. This allows you to write Python code to orchestrate other tools "
-            "(e.g., file_read, web_search) and process their output locally. "
-            "Instead of making multiple individual tool calls, write a single script to handle the logic and return only the final result.\n\n"
-            "【工具与 Skill 使用】\n"
-            "调用工具前先查看 Whiteboard 的 current_task_context 和 Hot Memory 的 L2 Context：若已存在 fact_checked=true 的可靠结论，应优先复用；"
-            "若只有 fact_checked=false 的假设，需要通过工具补充或复核后再做判断。"
-            "使用技能时，优先调用 'skill_summary' 获取列表，仅在确实需要时再用 'skill_load' 加载单个技能详情，避免一次性加载全部技能。\n\n"
-            "【系统能力与运维】\n"
-            "系统能力（daemon、heartbeat、cron、skills 等）通过 system_capabilities 提供，你可以结合 'file_read'、'file_write' 和 'shell_exec' 分析或调整状态，"
-            "但涉及任务调度、心跳、定时任务变更时，应在回答中明确提示风险并要求用户确认。\n\n"
-            "【输出与检索规范】\n"
-            "输出语言必须与用户输入保持一致。回答涉及最新事件或动态数据时，应优先使用 'web_search' 或相关工具，并在确认信息后再给出结论。"
-        )
-        
-        system_content = f"{role_desc}\n{system_instructions}"
-        if len(system_content) > 6000:
-            system_content = system_content[:6000] + "\n...[system instructions truncated]\n"
+        system_content = f"{role_desc}\n{_SYSTEM_INSTRUCTIONS}"
+        if len(system_content) > _MAX_SYSTEM_CHARS:
+            system_content = system_content[:_MAX_SYSTEM_CHARS] + "\n...[system instructions truncated]\n"
         messages.append({"role": "system", "content": system_content})
 
         # 3. History
@@ -195,31 +277,40 @@ class CoreAgent:
         keys = ["skill", "技能", "skill_summary", "skill_load", "加载技能", "可用技能"]
         return any(k in text for k in keys)
 
+    def _skill_tools(self) -> List[Dict[str, Any]]:
+        """Adapter tool definitions restricted to self.ctx.skills, in adapter order.
+
+        The swarm manager swaps ctx.skills per role, so the filtered list is
+        cached against the current skills dict and adapter definitions.
+        """
+        skills = self.ctx.skills
+        defs = self._tool_adapter.get_tool_definitions_map()
+        cached = self._tools_cache
+        if cached is not None and cached[0] is skills and cached[1] == len(skills) and cached[2] is defs:
+            return cached[3]
+        tools = [tool for name, tool in defs.items() if name in skills]
+        self._tools_cache = (skills, len(skills), defs, tools)
+        return tools
+
     def step(self, user_input: str) -> str:
         messages = self._build_messages(user_input)
         
         # Inject tool definitions from adapter
         # Filter tools based on self.ctx.skills
         # Only expose tools that are in the skills list
-        all_tools = self._tool_adapter.get_tool_definitions()
-        
         tools = []
-        if self.enable_tools:
-            if self.ctx.skills:
-                for tool in all_tools:
-                    tool_name = tool["function"]["name"]
-                    if tool_name in self.ctx.skills:
-                        tools.append(tool)
-            else:
-                tools = []
+        if self.enable_tools and self.ctx.skills:
+            tools = self._skill_tools()
         if tools and not self._should_enable_skill_tools(user_input):
             tools = [t for t in tools if not t["function"]["name"].startswith("skill_")]
         
-        # Chain of Thought Logging
-        if not self.quiet:
-            print(f"[CoT] Agent {self.ctx.role} starting thought process...")
+        # Chain of Thought Logging (DEBUG level; skipped entirely for quiet agents)
+        cot = not self.quiet and logger.isEnabledFor(logging.DEBUG)
+        if cot:
+            logger.debug("[CoT] Agent %s starting thought process...", self.ctx.role)
         
         try:
+            # Holds the same list object; tool rounds append to `messages` in place.
             completion_kwargs: Dict[str, Any] = {"messages": messages}
             if tools:
                 completion_kwargs["tools"] = tools
@@ -233,24 +324,21 @@ class CoreAgent:
                 content = self._clean_visible_content(message.content or "")
                 tool_calls = message.tool_calls
 
-                if round_idx == 0 and content and not self.quiet:
-                    print(f"[CoT] {self.ctx.role} thought: {content[:200]}...")
+                if round_idx == 0 and content and cot:
+                    logger.debug("[CoT] %s thought: %.200s...", self.ctx.role, content)
 
                 if not tool_calls:
-                    if round_idx > 0 and not self.quiet:
-                        print(f"[CoT] {self.ctx.role} final thought: {content[:200]}...")
+                    if round_idx > 0 and cot:
+                        logger.debug("[CoT] %s final thought: %.200s...", self.ctx.role, content)
                     break
 
                 messages.append(self._message_to_dict(message))
                 
                 # Execute tools in parallel
-                from concurrent.futures import ThreadPoolExecutor, as_completed
-                
                 def execute_single_tool(tc):
                     func_name = tc.function.name
                     # Tool name sanitization
                     if self._tool_adapter.registry.get_tool(func_name) is None:
-                        import re
                         matched = re.match(r"[A-Za-z0-9_]+", func_name or "")
                         if matched:
                             candidate = matched.group(0)
@@ -265,12 +353,12 @@ class CoreAgent:
                         }
                     
                     func_args_str = tc.function.arguments
-                    if not self.quiet:
-                        print(f"[CoT] {self.ctx.role} calls tool: {func_name}({func_args_str[:50]}...)")
+                    if cot:
+                        logger.debug("[CoT] %s calls tool: %s(%.50s...)", self.ctx.role, func_name, func_args_str)
 
                     try:
-                        func_args = json.loads(func_args_str)
-                    except json.JSONDecodeError:
+                        func_args = json_loads(func_args_str)
+                    except JSONDecodeError:
                         func_args = {}
 
                     tool_context = {}
@@ -278,8 +366,8 @@ class CoreAgent:
                         tool_context["memory_map"] = self.memory.whiteboard
                         
                     result = self._tool_adapter.execute(func_name, func_args, context=tool_context)
-                    if not self.quiet:
-                        print(f"[CoT] Tool result: {str(result)[:100]}...")
+                    if cot:
+                        logger.debug("[CoT] Tool result: %.100s...", result)
                     
                     return {
                         "role": "tool",
@@ -289,7 +377,7 @@ class CoreAgent:
                     }
 
                 if tool_calls:
-                    max_workers = len(tool_calls)
+                    max_workers = min(len(tool_calls), MAX_TOOL_WORKERS)
                     
                     with ThreadPoolExecutor(max_workers=max_workers) as executor:
                         # Map tool calls to futures
@@ -299,40 +387,41 @@ class CoreAgent:
                         futures = [executor.submit(execute_single_tool, tc) for tc in tool_calls]
                         
                         # Collect results in order
-                        for future in futures:
+                        for tc, future in zip(tool_calls, futures):
                             try:
                                 msg = future.result()
                                 messages.append(msg)
                             except Exception as e:
                                 print(f"[Agent {self.ctx.role}] Tool Execution Error: {e}")
-                                # Append error message to history to avoid hanging LLM state
+                                # Append error message to history to avoid hanging LLM state;
+                                # the reply must carry the call's id or the next request is rejected.
                                 messages.append({
                                     "role": "tool",
-                                    "tool_call_id": "unknown", # We might lose ID if future fails before returning it
-                                    "name": "unknown",
+                                    "tool_call_id": getattr(tc, "id", None) or "unknown",
+                                    "name": getattr(getattr(tc, "function", None), "name", None) or "unknown",
                                     "content": f"Error: {str(e)}"
                                 })
-
-                completion_kwargs["messages"] = messages
             else:
                 # If we exhausted max_tool_rounds, we force a final response generation
                 # based on the accumulated tool results.
-                if not self.quiet:
-                    print(f"[CoT] {self.ctx.role} exhausted tool rounds. Generating final response...")
+                if cot:
+                    logger.debug("[CoT] %s exhausted tool rounds. Generating final response...", self.ctx.role)
                 # Remove tools to force a text response (optional, but safer to avoid infinite loops)
                 if "tools" in completion_kwargs:
                     del completion_kwargs["tools"]
                 
                 resp = self.llm.completion(**completion_kwargs)
                 content = self._clean_visible_content(resp.choices[0].message.content or "")
-                if content and not self.quiet:
-                    print(f"[CoT] {self.ctx.role} final thought: {content[:200]}...")
+                if content and cot:
+                    logger.debug("[CoT] %s final thought: %.200s...", self.ctx.role, content)
 
         except Exception as e:
             content = f"Error during execution: {str(e)}"
             if not self.quiet:
                 print(f"[Agent {self.ctx.role}] Error: {e}")
             
-        self.memory.add_event(self.ctx.agent_id, user_input, {"kind": "user"})
-        self.memory.add_event(self.ctx.agent_id, content, {"kind": "assistant"})
+        self.memory.add_events(
+            self.ctx.agent_id,
+            [(user_input, {"kind": "user"}), (content, {"kind": "assistant"})],
+        )
         return content
@@ -1,23 +1,37 @@
 import os
 import sys
 import time
-import json
 import shutil
 import hashlib
 import signal
+import subprocess
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 
-from .config_manager import CONFIG_HOME, CONFIG_PATH, BOOT_CONFIG_PATH
+try:
+    import fcntl
+except ImportError:  # not available on Windows; backups fall back to plain copies
+    fcntl = None
 
+from .config_manager import CONFIG_HOME, CONFIG_PATH, BOOT_CONFIG_PATH
+from .json_compat import dumpb as json_dumpb, loads as json_loads
+from .shutdown import set_on_signals
 
 PID_FILE = os.path.join(CONFIG_HOME, "daemon.pid")
 STATE_FILE = os.path.join(CONFIG_HOME, "daemon_state.json")
 BACKUP_ROOT = os.path.join(CONFIG_HOME, "backups")
+# Hash input is read in 1 MiB unbuffered chunks so OpenSSL's SHA-256 (SHA-NI
+# where available) runs over long spans instead of 8 KiB Python round-trips.
+_HASH_CHUNK = 1 << 20
+# Linux FICLONE ioctl: share extents copy-on-write (btrfs, xfs with reflink).
+_FICLONE = 0x40049409
 
 
 def _load_daemon_config() -> dict:
     try:
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(CONFIG_PATH, "rb") as f:
+            data = json_loads(f.read())
     except Exception:
         return {}
     return data.get("daemon", {})
@@ -27,26 +41,42 @@ def _load_state() -> dict:
     if not os.path.exists(STATE_FILE):
         return {}
     try:
-        with open(STATE_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(STATE_FILE, "rb") as f:
+            return json_loads(f.read())
     except Exception:
         return {}
 
 
+# Bytes of the last state file this process wrote; identical states are not rewritten.
+_last_state_bytes: bytes | None = None
+
+
 def _save_state(state: dict) -> None:
+    global _last_state_bytes
+    payload = json_dumpb(state, indent=True)
+    if payload == _last_state_bytes:
+        return
     os.makedirs(CONFIG_HOME, exist_ok=True)
     tmp = STATE_FILE + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(state, f, ensure_ascii=False, indent=2)
+    with open(tmp, "wb") as f:
+        f.write(payload)
     os.replace(tmp, STATE_FILE)
+    _last_state_bytes = payload
+
+
+def _hash_update_file(h, path: str) -> None:
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            chunk = f.read(_HASH_CHUNK)
+            if not chunk:
+                break
+            h.update(chunk)
 
 
 def _hash_file(path: str) -> str:
     h = hashlib.sha256()
     try:
-        with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
+        _hash_update_file(h, path)
     except Exception:
         return ""
     return h.hexdigest()
@@ -65,9 +95,7 @@ def _hash_boot_dir() -> str:
                 rel = os.path.relpath(full, BOOT_CONFIG_PATH)
                 h.update(rel.encode("utf-8", errors="ignore"))
                 try:
-                    with open(full, "rb") as f:
-                        for chunk in iter(lambda: f.read(8192), b""):
-                            h.update(chunk)
+                    _hash_update_file(h, full)
                 except Exception:
                     continue
     except Exception:
@@ -75,23 +103,110 @@ def _hash_boot_dir() -> str:
     return h.hexdigest()
 
 
-def _copy_tree(src: str, dst: str) -> None:
+def _stat_key(path: str) -> list:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return []
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _boot_dir_snapshot() -> dict:
+    """{relative .md path: [mtime_ns, size]} for the files _hash_boot_dir() reads."""
+    snapshot = {}
+    if not os.path.isdir(BOOT_CONFIG_PATH):
+        return snapshot
+    for root, _, files in os.walk(BOOT_CONFIG_PATH):
+        for name in files:
+            if not name.endswith(".md"):
+                continue
+            full = os.path.join(root, name)
+            snapshot[os.path.relpath(full, BOOT_CONFIG_PATH)] = _stat_key(full)
+    return snapshot
+
+
+def _snapshot_file(src: str, dst: str, prev: str | None = None) -> None:
+    """Copy src to dst as cheaply as the filesystem allows.
+
+    A file identical (same size and mtime) to ``prev`` in the previous
+    backup is hard-linked to it; otherwise a reflink is tried before a
+    byte copy. Live files are never linked, so editing them cannot alter a
+    backup.
+    """
+    if prev is not None:
+        try:
+            src_st = os.stat(src)
+            prev_st = os.stat(prev)
+            if src_st.st_size == prev_st.st_size and src_st.st_mtime_ns == prev_st.st_mtime_ns:
+                os.link(prev, dst)
+                return
+        except OSError:
+            pass
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
+def _copy_tree(src: str, dst: str, link_dest: str | None = None) -> None:
+    """Copy src to dst; files unchanged since ``link_dest`` (an older copy) are hard-linked."""
     if not os.path.exists(src):
         return
     if os.path.exists(dst):
         shutil.rmtree(dst, ignore_errors=True)
-    shutil.copytree(src, dst)
+    if link_dest is not None and not os.path.isdir(link_dest):
+        link_dest = None
+
+    def copy_function(s: str, d: str) -> None:
+        prev = os.path.join(link_dest, os.path.relpath(s, src)) if link_dest else None
+        _snapshot_file(s, d, prev)
+
+    shutil.copytree(src, dst, copy_function=copy_function)
+
+
+def _prune_backups(keep) -> None:
+    """Remove the oldest backup_* snapshots beyond the newest ``keep`` (0 keeps all)."""
+    try:
+        keep = int(keep)
+        # backup_YYYYmmdd_HHMMSS names sort chronologically.
+        names = sorted(n for n in os.listdir(BACKUP_ROOT) if n.startswith("backup_"))
+    except (TypeError, ValueError, OSError):
+        return
+    if keep <= 0:
+        return
+    stale = names[:-keep]
+    if not stale:
+        return
+    print(f"[Daemon] Pruned {len(stale)} old backup(s), keeping the newest {keep}")
+    for name in stale:
+        shutil.rmtree(os.path.join(BACKUP_ROOT, name), ignore_errors=True)
 
 
 def _perform_backup_if_changed(state: dict) -> dict:
     os.makedirs(BACKUP_ROOT, exist_ok=True)
     last_config_hash = state.get("last_config_hash", "")
     last_boot_hash = state.get("last_boot_hash", "")
-    config_hash = _hash_file(CONFIG_PATH)
-    boot_hash = _hash_boot_dir()
+    # Only re-hash inputs whose stat() metadata moved since the last check.
+    config_stat = _stat_key(CONFIG_PATH)
+    if last_config_hash and config_stat and config_stat == state.get("config_stat"):
+        config_hash = last_config_hash
+    else:
+        config_hash = _hash_file(CONFIG_PATH)
+    boot_snapshot = _boot_dir_snapshot()
+    if last_boot_hash and boot_snapshot and boot_snapshot == state.get("boot_stat_snapshot"):
+        boot_hash = last_boot_hash
+    else:
+        boot_hash = _hash_boot_dir()
     if not config_hash and not boot_hash:
         return state
     if config_hash == last_config_hash and boot_hash == last_boot_hash:
+        state["config_stat"] = config_stat
+        state["boot_stat_snapshot"] = boot_snapshot
         return state
     ts = time.strftime("%Y%m%d_%H%M%S")
     backup_dir = os.path.join(BACKUP_ROOT, f"backup_{ts}")
@@ -99,7 +214,10 @@ def _perform_backup_if_changed(state: dict) -> dict:
     if os.path.exists(CONFIG_PATH):
         shutil.copy2(CONFIG_PATH, os.path.join(backup_dir, "config.json"))
     if os.path.isdir(BOOT_CONFIG_PATH):
-        _copy_tree(BOOT_CONFIG_PATH, os.path.join(backup_dir, "boot"))
+        prev_boot = None
+        if state.get("last_backup_ts"):
+            prev_boot = os.path.join(BACKUP_ROOT, f"backup_{state['last_backup_ts']}", "boot")
+        _copy_tree(BOOT_CONFIG_PATH, os.path.join(backup_dir, "boot"), link_dest=prev_boot)
     cfg = _load_daemon_config()
     remote_path = cfg.get("backup_remote_path") or ""
     if remote_path:
@@ -110,22 +228,37 @@ def _perform_backup_if_changed(state: dict) -> dict:
             _copy_tree(backup_dir, remote_dir)
         except Exception:
             pass
+    # Unchanged files are hard links shared between snapshots, so pruning
+    # old ones frees only the versions no newer backup still references.
+    _prune_backups(cfg.get("backup_keep_last", 0))
     state["last_config_hash"] = config_hash
     state["last_boot_hash"] = boot_hash
+    # Stat snapshots are only stored next to the hashes they vouch for.
+    state["config_stat"] = config_stat
+    state["boot_stat_snapshot"] = boot_snapshot
     state["last_backup_ts"] = ts
     return state
 
 
-def _check_llm_health() -> str:
+# Keys _perform_backup_if_changed() owns in the daemon state.
+_BACKUP_STATE_KEYS = ("last_config_hash", "last_boot_hash", "config_stat", "boot_stat_snapshot", "last_backup_ts")
+
+
+def _merge_backup_result(state: dict, future) -> None:
+    """Copy the backup bookkeeping from a finished backup job into state."""
     try:
-        from .config_manager import load_config
+        result = future.result()
+    except Exception:
+        return
+    for key in _BACKUP_STATE_KEYS:
+        if key in result:
+            state[key] = result[key]
 
-        cfg = load_config()
-        # Use primary provider
-        primary = cfg.providers[0] if cfg.providers else None
-        base = primary.base_url if primary else None
-        if not base:
-            return "unknown"
+
+def _probe_llm(base: str | None) -> str:
+    if not base:
+        return "unknown"
+    try:
         import urllib.request
 
         req = urllib.request.Request(base, method="GET")
@@ -138,6 +271,30 @@ def _check_llm_health() -> str:
         return f"error:{e.__class__.__name__}"
 
 
+def _check_llm_health() -> dict:
+    """Probe every configured provider concurrently.
+
+    Returns {provider name: status} in failover order, so the first entry
+    is the primary provider.
+    """
+    try:
+        from .config_manager import load_config
+
+        providers = list(load_config().providers)
+    except Exception as e:
+        return {"primary": f"error:{e.__class__.__name__}"}
+    if not providers:
+        return {"primary": "unknown"}
+    names = []
+    for i, p in enumerate(providers):
+        name = p.name or f"provider_{i + 1}"
+        names.append(name if name not in names else f"{name}_{i + 1}")
+    # Each probe may block for its 5 s timeout; run them side by side.
+    with ThreadPoolExecutor(max_workers=min(len(providers), 8)) as pool:
+        statuses = list(pool.map(_probe_llm, [p.base_url for p in providers]))
+    return dict(zip(names, statuses))
+
+
 def _check_channel_health(services: dict) -> dict:
     status: dict = {}
     try:
@@ -193,25 +350,31 @@ def _ensure_service(
     try:
         os.makedirs(os.path.join(CONFIG_HOME, "logs"), exist_ok=True)
         log_path = os.path.join(CONFIG_HOME, "logs", f"daemon_{name}.log")
-        with open(log_path, "a") as f:
-            p = __import__("subprocess").Popen(
+        # Raw O_APPEND fd: the child only needs the descriptor, not a Python
+        # file object, and O_CLOEXEC keeps it out of any later forks.
+        log_fd = os.open(
+            log_path,
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_CLOEXEC", 0),
+            0o644,
+        )
+        try:
+            p = subprocess.Popen(
                 cmd,
-                stdout=f,
-                stderr=__import__("subprocess").STDOUT,
+                stdout=log_fd,
+                stderr=subprocess.STDOUT,
                 start_new_session=True,
             )
+        finally:
+            os.close(log_fd)
         svc["proc"] = p
         svc["last_start"] = now
     except Exception:
         svc["last_start"] = now
 
 
-_shutdown = False
-
-
-def _signal_handler(signum, frame) -> None:
-    global _shutdown
-    _shutdown = True
+# Set on SIGTERM/SIGINT (via shutdown.set_on_signals); the main loop parks on
+# it between ticks.
+_stop_event = threading.Event()
 
 
 def _validate_config() -> bool:
@@ -297,8 +460,7 @@ def main() -> None:
             f.write(str(os.getpid()))
     except Exception:
         pass
-    signal.signal(signal.SIGTERM, _signal_handler)
-    signal.signal(signal.SIGINT, _signal_handler)
+    set_on_signals(_stop_event)
     cfg = _load_daemon_config()
     state = _load_state()
     backup_interval = int(cfg.get("backup_interval_seconds", 60))
@@ -313,7 +475,13 @@ def main() -> None:
     services: dict = {}
     last_backup = 0.0
     last_health = 0.0
-    while not _shutdown:
+    # Backups (hash + copy) and the LLM probe (network) run off the loop
+    # thread so service restarts and state writes never wait on them.
+    workers = ThreadPoolExecutor(max_workers=2, thread_name_prefix="swarmbot-daemon")
+    backup_future = None
+    health_future = None
+    last_error = None
+    while not _stop_event.is_set():
         now = time.time()
         try:
             _ensure_service(
@@ -337,27 +505,43 @@ def main() -> None:
                 [sys.executable, "-m", "swarmbot.cli", "autonomous", "start"],
                 int(cfg.get("autonomous_restart_delay_seconds", 30)),
             )
-            if now - last_backup >= backup_interval:
-                state = _perform_backup_if_changed(state)
+            if backup_future is not None and backup_future.done():
+                _merge_backup_result(state, backup_future)
+                backup_future = None
+            if backup_future is None and now - last_backup >= backup_interval:
+                # The job gets its own copy; the loop keeps writing state meanwhile.
+                backup_future = workers.submit(_perform_backup_if_changed, dict(state))
                 last_backup = now
-            if now - last_health >= health_interval:
-                state["llm_health"] = _check_llm_health()
+            if health_future is not None and health_future.done():
+                try:
+                    provider_health = health_future.result()
+                except Exception as e:
+                    provider_health = {"primary": f"error:{e.__class__.__name__}"}
+                state["provider_health"] = provider_health
+                # Primary provider's status, kept for existing readers of llm_health.
+                state["llm_health"] = next(iter(provider_health.values()), "unknown")
+                health_future = None
+            if health_future is None and now - last_health >= health_interval:
+                health_future = workers.submit(_check_llm_health)
                 state["channels"] = _check_channel_health(services)
                 last_health = now
-            state["services"] = {
-                name: {
-                    "pid": svc.get("proc").pid if svc.get("proc") is not None and svc.get("proc").poll() is None else None,
-                    "last_start": svc.get("last_start", 0.0),
-                }
-                for name, svc in services.items()
-            }
+            snapshot = {}
+            for name, svc in services.items():
+                proc = svc.get("proc")
+                # poll() reaps via waitpid(); call it once per service.
+                alive = proc is not None and proc.poll() is None
+                snapshot[name] = {"pid": proc.pid if alive else None, "last_start": svc.get("last_start", 0.0)}
+            state["services"] = snapshot
             _save_state(state)
-        except Exception:
-            pass
-        for _ in range(5):
-            if _shutdown:
-                break
-            time.sleep(1)
+        except Exception as e:
+            # Keep supervising, but report each distinct failure once rather than every tick.
+            if repr(e) != last_error:
+                print(f"[Daemon] Loop iteration failed: {e!r}")
+                traceback.print_exc()
+                last_error = repr(e)
+        else:
+            last_error = None
+        _stop_event.wait(5)
 
     # Shutdown all services gracefully
     print("[Daemon] Shutting down all services...")
@@ -367,18 +551,24 @@ def main() -> None:
             try:
                 proc.terminate()
                 print(f"[Daemon] Sent SIGTERM to {name} (PID={proc.pid})")
-                # Wait for graceful shutdown
-                for _ in range(50):
-                    if proc.poll() is not None:
-                        break
-                    time.sleep(0.1)
-                # Force kill if still running
-                if proc.poll() is None:
+                # Wait for graceful shutdown, then force kill if still running
+                try:
+                    proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
                     proc.kill()
                     print(f"[Daemon] Force killed {name}")
             except Exception as e:
                 print(f"[Daemon] Error stopping {name}: {e}")
 
+    # Let an in-flight backup finish so its hashes are recorded.
+    workers.shutdown(wait=True)
+    if backup_future is not None:
+        _merge_backup_result(state, backup_future)
+        try:
+            _save_state(state)
+        except Exception:
+            pass
+
     try:
         if os.path.exists(PID_FILE):
             with open(PID_FILE, "r", encoding="utf-8") as f:
@@ -2,14 +2,13 @@ from __future__ import annotations
 
 import importlib
 import json
-import os
 import re
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ..boot.context_loader import load_boot_markdown
-from ..config_manager import load_config
+from ..config_manager import BOOT_CONFIG_PATH, load_config
 from ..llm_client import OpenAICompatibleClient
 from ..memory.hot_memory import HotMemory
 from ..memory.warm_memory import WarmMemory
@@ -74,7 +73,7 @@ class GatewayMasterAgent:
 
     def _load_tools(self):
         """从 inference_tools.md 加载工具配置并动态导入"""
-        config_path = Path(os.path.expanduser("~/.swarmbot/boot/inference/inference_tools.md"))
+        config_path = Path(BOOT_CONFIG_PATH) / "inference" / "inference_tools.md"
         if not config_path.exists():
             config_path = Path(__file__).parent.parent / "boot" / "inference" / "inference_tools.md"
         
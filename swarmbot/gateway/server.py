@@ -24,11 +24,14 @@ except ImportError:
 
 from loguru import logger
 
+try:
+    import uvloop
+except ImportError:  # optional; the stock asyncio loop is used without it
+    uvloop = None
+
 # --- Imports ---
 from swarmbot.config_manager import load_config, SwarmbotConfig, WORKSPACE_PATH
 from nanobot.bus.queue import MessageBus, InboundMessage, OutboundMessage
-from nanobot.channels.feishu import FeishuChannel
-from nanobot.config.schema import FeishuConfig
 
 from swarmbot.autonomous import AutonomousEngine
 from swarmbot.gateway.orchestrator import GatewayMasterAgent
@@ -65,6 +68,12 @@ class GatewayServer:
     async def start(self):
         logger.info("Starting Swarmbot Gateway (v2.0.2) with GatewayMasterAgent...")
 
+        # Python 3.12+: new tasks run synchronously up to their first real
+        # suspension, so handlers that finish without waiting skip a loop round-trip.
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is not None:
+            asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
         # 1. Initialize Channels
         await self._init_channels()
 
@@ -107,6 +116,10 @@ class GatewayServer:
             if enabled:
                 logger.info("Initializing Feishu channel...")
                 try:
+                    # Imported only when enabled: the channel pulls in the lark-oapi SDK.
+                    from nanobot.channels.feishu import FeishuChannel
+                    from nanobot.config.schema import FeishuConfig
+
                     app_id = conf_data.get("app_id") or conf_data.get("appId")
                     app_secret = conf_data.get("app_secret") or conf_data.get("appSecret")
                     encrypt_key = conf_data.get("encrypt_key") or conf_data.get("encryptKey") or ""
@@ -302,6 +315,17 @@ class GatewayServer:
             asyncio.create_task(ch.stop())
         self._executor.shutdown(wait=False)
 
+def _run_event_loop(main):
+    """asyncio.run(main), on a uvloop loop when uvloop is installed."""
+    if uvloop is None:
+        return asyncio.run(main)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(main)
+    uvloop.install()
+    return asyncio.run(main)
+
+
 def run_gateway():
     logging.basicConfig(level=logging.INFO)
     logger.remove()
@@ -309,7 +333,7 @@ def run_gateway():
     
     try:
         server = GatewayServer()
-        asyncio.run(server.start())
+        _run_event_loop(server.start())
     except KeyboardInterrupt:
         pass
     except Exception as e:
@@ -7,7 +7,7 @@ import httpx
 from litellm import completion as litellm_completion, acompletion as litellm_acompletion
 
 from .config import LLMConfig
-from .config_manager import ProviderConfig, load_config
+from .config_manager import CONFIG_HOME, ProviderConfig, load_config
 
 # Disable LiteLLM logging noise
 litellm_completion.__globals__["litellm"].suppress_debug_info = True
@@ -282,7 +282,7 @@ class OpenAICompatibleClient:
                     try:
                         import os
                         import json as _json
-                        log_dir = os.path.expanduser("~/.swarmbot/logs")
+                        log_dir = os.path.join(CONFIG_HOME, "logs")
                         os.makedirs(log_dir, exist_ok=True)
                         ts = int(time.time())
                         log_path = os.path.join(log_dir, f"llm_error_prompt_{ts}.json")
@@ -301,7 +301,7 @@ class OpenAICompatibleClient:
                     try:
                         import os
                         import json as _json
-                        log_dir = os.path.expanduser("~/.swarmbot/logs")
+                        log_dir = os.path.join(CONFIG_HOME, "logs")
                         os.makedirs(log_dir, exist_ok=True)
                         ts = int(time.time())
                         log_path = os.path.join(log_dir, f"llm_error_prompt_{ts}.json")
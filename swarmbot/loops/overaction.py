@@ -10,14 +10,14 @@ from ..llm_client import OpenAICompatibleClient
 from ..memory.hot_memory import HotMemory
 from ..memory.warm_memory import WarmMemory
 from ..memory.cold_memory import ColdMemory
-from ..config_manager import load_config
+from ..config_manager import WORKSPACE_PATH, load_config
 from .definitions import OVERACTION_REFINE_PROMPT, OVERACTION_OPT_PROMPT
 
 class OveractionLoop:
     def __init__(self, stop_event: threading.Event):
         self.stop_event = stop_event
         self.config = load_config()
-        workspace = getattr(self.config, "workspace_path", os.path.expanduser("~/.swarmbot/workspace"))
+        workspace = getattr(self.config, "workspace_path", WORKSPACE_PATH)
         self.workspace = workspace
         self.over_cfg = getattr(self.config, "overaction", None)
         self.hot_memory = HotMemory(workspace)
@@ -7,7 +7,7 @@ from ..llm_client import OpenAICompatibleClient
 from ..memory.hot_memory import HotMemory
 from ..memory.warm_memory import WarmMemory
 from ..memory.cold_memory import ColdMemory
-from ..config_manager import load_config
+from ..config_manager import WORKSPACE_PATH, load_config
 from .definitions import OVERTHINKING_PROMPT
 from .overaction import OveractionLoop
 
@@ -21,7 +21,7 @@ class OverthinkingLoop:
     def __init__(self, stop_event: threading.Event):
         self.stop_event = stop_event
         self.config = load_config()
-        workspace = getattr(self.config, "workspace_path", os.path.expanduser("~/.swarmbot/workspace"))
+        workspace = getattr(self.config, "workspace_path", WORKSPACE_PATH)
         
         self.hot_memory = HotMemory(workspace)
         self.warm_memory = WarmMemory(workspace)
@@ -155,7 +155,7 @@ class OverthinkingLoop:
         state = self._load_ext_state()
         now = int(time.time())
         events = []
-        source_file = os.path.join(os.path.expanduser("~/.swarmbot/workspace"), "external_events.json")
+        source_file = os.path.join(WORKSPACE_PATH, "external_events.json")
         if os.path.exists(source_file):
             try:
                 with open(source_file, "r", encoding="utf-8") as f:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Tuple
 
 
 class MemoryStore(ABC):
@@ -9,6 +9,11 @@ class MemoryStore(ABC):
     def add_event(self, agent_id: str, content: str, meta: Dict[str, Any] | None = None) -> None:
         raise NotImplementedError
 
+    def add_events(self, agent_id: str, events: Iterable[Tuple[str, Dict[str, Any] | None]]) -> None:
+        """Record several (content, meta) events; stores may override to write them in one go."""
+        for content, meta in events:
+            self.add_event(agent_id, content, meta)
+
     @abstractmethod
     def get_context(self, agent_id: str, limit: int = 20, query: str | None = None) -> List[Dict[str, Any]]:
         raise NotImplementedError
@@ -8,6 +8,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List
 
+from ..config_manager import CONFIG_HOME
+
 
 @dataclass
 class EvidenceRecord:
@@ -21,7 +23,7 @@ class EvidenceRecord:
 
 class EvidenceStore:
     def __init__(self, root: str | None = None):
-        self.root = Path(root or os.path.expanduser("~/.swarmbot/evidence"))
+        self.root = Path(root or os.path.join(CONFIG_HOME, "evidence"))
         self.root.mkdir(parents=True, exist_ok=True)
 
     def classify_domain(self, question: str) -> str:
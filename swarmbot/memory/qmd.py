@@ -5,7 +5,7 @@ import os
 import subprocess
 import time
 import fcntl
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .base import MemoryStore
 from ..config_manager import WORKSPACE_PATH
@@ -158,31 +158,38 @@ class QMDMemoryStore(MemoryStore):
         pass
 
     def add_event(self, agent_id: str, content: str, meta: Dict[str, Any] | None = None) -> None:
-        # Validation: Do not store empty content
-        if not content or not content.strip():
-            return
+        self.add_events(agent_id, [(content, meta)])
+
+    def add_events(self, agent_id: str, events: Iterable[Tuple[str, Dict[str, Any] | None]]) -> None:
+        """Record events in order; the daily log gets a single locked append per batch."""
+        log_entries = []
+        for content, meta in events:
+            # Validation: Do not store empty content
+            if not content or not content.strip():
+                continue
+
+            # 1. Update In-memory buffer
+            if agent_id not in self._events:
+                self._events[agent_id] = []
             
-        # 1. Update In-memory buffer
-        if agent_id not in self._events:
-            self._events[agent_id] = []
-        
-        event = {
-            "content": content,
-            "meta": meta or {},
-            "timestamp": time.time()
-        }
-        self._events[agent_id].append(event)
-        
+            event = {
+                "content": content,
+                "meta": meta or {},
+                "timestamp": time.time()
+            }
+            self._events[agent_id].append(event)
+            log_entries.append(f"\n## [{time.strftime('%H:%M:%S')}] {agent_id}\n{content}\n")
+            
+            # 3. Update Whiteboard (if meta contains 'update_map')
+            if meta and "update_map" in meta:
+                for k, v in meta["update_map"].items():
+                    self.whiteboard.update(k, v)
+
         # 2. Persist to LocalMD (Daily/Session Log) using Atomic Append
-        date_str = time.strftime("%Y-%m-%d")
-        log_file = f"chat_log_{date_str}.md"
-        log_entry = f"\n## [{time.strftime('%H:%M:%S')}] {agent_id}\n{content}\n"
-        self.local_cache.append(log_file, log_entry)
-        
-        # 3. Update Whiteboard (if meta contains 'update_map')
-        if meta and "update_map" in meta:
-            for k, v in meta["update_map"].items():
-                self.whiteboard.update(k, v)
+        if log_entries:
+            date_str = time.strftime("%Y-%m-%d")
+            log_file = f"chat_log_{date_str}.md"
+            self.local_cache.append(log_file, "".join(log_entries))
 
     def add(self, content: str, meta: Dict[str, Any] | None = None) -> None:
         """
@@ -3,9 +3,14 @@ from __future__ import annotations
 import os
 import json
 import sqlite3
+import threading
 import time
 import math
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+# Distinct (query, collection, limit) results kept per store.
+_SEARCH_CACHE_SIZE = 256
+
 
 class EmbeddedQMD:
     """
@@ -22,8 +27,20 @@ class EmbeddedQMD:
         self.root = root_path
         os.makedirs(self.root, exist_ok=True)
         self.db_path = os.path.join(self.root, "qmd.sqlite")
+        # Recent search results, valid while the database file is unchanged
+        # (same mtime/size); add() and writes from other processes reset it.
+        self._search_cache: Dict[Tuple[str, Optional[str], int], List[Dict[str, Any]]] = {}
+        self._search_stamp: Optional[Tuple[int, int]] = None
+        self._search_lock = threading.Lock()
         self._init_db()
 
+    def _db_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.db_path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
     def _init_db(self):
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
@@ -92,6 +109,10 @@ class EmbeddedQMD:
                     
         meta_json = json.dumps(safe_meta, ensure_ascii=False)
         
+        with self._search_lock:
+            self._search_cache.clear()
+            self._search_stamp = None
+
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             if self.has_fts:
@@ -102,6 +123,27 @@ class EmbeddedQMD:
                                (coll_id, safe_content, meta_json, time.time()))
 
     def search(self, query: str, collection: Optional[str] = None, limit: int = 5) -> List[Dict[str, Any]]:
+        # Every agent in a swarm turn recalls context for the same user input,
+        # so identical searches are answered from memory until the DB changes.
+        key = (query, collection, limit)
+        stamp = self._db_stamp()
+        with self._search_lock:
+            if stamp is not None and stamp == self._search_stamp:
+                cached = self._search_cache.get(key)
+                if cached is not None:
+                    return [dict(r) for r in cached]
+        results = self._search_db(query, collection, limit)
+        if stamp is not None and stamp == self._db_stamp():
+            with self._search_lock:
+                if stamp != self._search_stamp:
+                    self._search_cache.clear()
+                    self._search_stamp = stamp
+                if len(self._search_cache) >= _SEARCH_CACHE_SIZE:
+                    self._search_cache.pop(next(iter(self._search_cache)))
+                self._search_cache[key] = [dict(r) for r in results]
+        return results
+
+    def _search_db(self, query: str, collection: Optional[str], limit: int) -> List[Dict[str, Any]]:
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             
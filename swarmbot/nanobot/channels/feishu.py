@@ -323,7 +323,9 @@ class FeishuChannel(BaseChannel):
                     .build()
                 ).build()
 
-            response = self._client.im.v1.message.create(request)
+            # The lark SDK call is blocking; keep the gateway loop free while it runs.
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(None, self._client.im.v1.message.create, request)
 
             if response.success():
                 logger.debug(f"Feishu message sent to {msg.chat_id}")
@@ -344,7 +346,7 @@ class FeishuChannel(BaseChannel):
                     .content(text_content)
                     .build()
                 ).build()
-            fallback_resp = self._client.im.v1.message.create(fallback_req)
+            fallback_resp = await loop.run_in_executor(None, self._client.im.v1.message.create, fallback_req)
             if not fallback_resp.success():
                 logger.error(
                     f"Failed to send Feishu text fallback: code={fallback_resp.code}, "
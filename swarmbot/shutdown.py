@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import signal
+import socket
+import threading
+
+# The wakeup socket pair, kept referenced for the life of the process: if the
+# writer were collected, set_wakeup_fd() would point at a reused fd number.
+_wakeup: tuple[socket.socket, socket.socket] | None = None
+
+
+def set_on_signals(event: threading.Event, signums=(signal.SIGTERM, signal.SIGINT)) -> None:
+    """Set ``event`` when one of ``signums`` arrives, so callers can block in event.wait().
+
+    Must be called from the main thread. Calling event.set() from a signal
+    handler can deadlock: the handler runs on the main thread, which may be
+    holding the event's lock inside wait(). Instead, the interpreter writes
+    each signal number to a socket through signal.set_wakeup_fd(), and a
+    watcher thread sets the event from there.
+    """
+    global _wakeup
+    reader, writer = socket.socketpair()
+    writer.setblocking(False)
+    _wakeup = (reader, writer)
+    signal.set_wakeup_fd(writer.fileno(), warn_on_full_buffer=False)
+    wanted = {int(s) for s in signums}
+
+    def watch() -> None:
+        while True:
+            data = reader.recv(64)
+            if not data or wanted.intersection(data):
+                break
+        event.set()
+
+    threading.Thread(target=watch, name="swarmbot-signals", daemon=True).start()
+    for signum in signums:
+        # The wakeup fd only fires for signals with a Python-level handler;
+        # this one just replaces the default (exit / KeyboardInterrupt).
+        signal.signal(signum, lambda signum, frame: None)
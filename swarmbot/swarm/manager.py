@@ -7,7 +7,7 @@ import time
 from typing import Any, Dict, List, Literal, Optional
 
 from ..config import SwarmConfig
-from ..config_manager import SwarmbotConfig
+from ..config_manager import CONFIG_HOME, WORKSPACE_PATH, SwarmbotConfig
 from ..llm_client import OpenAICompatibleClient
 from ..memory.qmd import QMDMemoryStore
 from ..memory.hot_memory import HotMemory
@@ -38,7 +38,7 @@ class SwarmSession:
         # We'll assume default workspace or try to find it.
         # Actually SwarmConfig doesn't have workspace_path in definition usually.
         # Let's check config object.
-        workspace = getattr(config, "workspace_path", os.path.expanduser("~/.swarmbot/workspace"))
+        workspace = getattr(config, "workspace_path", WORKSPACE_PATH)
         self.hot_memory = HotMemory(workspace)
         self.skill_registry = SkillRegistry()
         
@@ -349,12 +349,11 @@ class SwarmManager:
 
         system_caps = {}
         try:
-            from ..config_manager import WORKSPACE_PATH
             from pathlib import Path
 
             workspace = Path(WORKSPACE_PATH)
             cron_store = workspace / "cron" / "jobs.json"
-            daemon_state = os.path.expanduser("~/.swarmbot/daemon_state.json")
+            daemon_state = os.path.join(CONFIG_HOME, "daemon_state.json")
             skills_workspace = workspace / "skills"
             skills_builtin = Path(__file__).resolve().parent.parent / "nanobot" / "skills"
             system_caps = {
@@ -32,6 +32,8 @@ class ToolAdapter:
         self._processes: Dict[str, subprocess.Popen] = {}
         self._process_meta: Dict[str, Dict[str, Any]] = {}
         self._proc_lock = threading.Lock()
+        # name -> OpenAI tool definition; rebuilt lazily after a registration.
+        self._defs_map: Optional[Dict[str, Dict[str, Any]]] = None
         self._load_skills()
         self.whiteboard: Any = None
         self.hot_memory: Any = None
@@ -67,6 +69,7 @@ class ToolAdapter:
             description=desc,
             parameters=parameters
         )
+        self._defs_map = None
         
         # Register to global registry
         if func:
@@ -247,18 +250,22 @@ class ToolAdapter:
             if not args:
                 return f"Current Swarm Config:\n{json.dumps(asdict(cfg.swarm), indent=2)}"
             
-            # Apply updates
-            if "max_agents" in args: cfg.swarm.max_agents = int(args["max_agents"])
+            # Parse every update before touching cfg: it is the shared cached
+            # instance, so a half-applied update would leak into later loads.
+            updates: Dict[str, Any] = {}
+            if "max_agents" in args: updates["max_agents"] = int(args["max_agents"])
             # Legacy support
-            if "agent_count" in args: cfg.swarm.max_agents = int(args["agent_count"])
+            if "agent_count" in args: updates["max_agents"] = int(args["agent_count"])
             
-            if "architecture" in args: cfg.swarm.architecture = str(args["architecture"])
-            if "max_turns" in args: cfg.swarm.max_turns = int(args["max_turns"])
+            if "architecture" in args: updates["architecture"] = str(args["architecture"])
+            if "max_turns" in args: updates["max_turns"] = int(args["max_turns"])
             if "auto_builder" in args: 
                 val = args["auto_builder"]
                 if isinstance(val, str): val = val.lower() in ("true", "1", "yes")
-                cfg.swarm.auto_builder = bool(val)
+                updates["auto_builder"] = bool(val)
             
+            for key, value in updates.items():
+                setattr(cfg.swarm, key, value)
             save_config(cfg)
             return f"Config updated:\n{json.dumps(asdict(cfg.swarm), indent=2)}"
 
@@ -266,11 +273,13 @@ class ToolAdapter:
             cfg = load_config()
             if subcommand == "add" and args:
                 # Update primary provider (create if not exists, update if exists)
-                from ..config_manager import LLMConfig
+                from ..config_manager import ProviderConfig
                 
+                # Validate before mutating the shared cached config.
+                max_tokens = int(args["max_tokens"]) if "max_tokens" in args else None
                 if not cfg.providers:
                     # Create new primary
-                    p = LLMConfig(name="primary")
+                    p = ProviderConfig(name="primary")
                     cfg.providers = [p]
                 else:
                     # Update existing primary
@@ -279,7 +288,7 @@ class ToolAdapter:
                 if "base_url" in args: p.base_url = args["base_url"]
                 if "api_key" in args: p.api_key = args["api_key"]
                 if "model" in args: p.model = args["model"]
-                if "max_tokens" in args: p.max_tokens = int(args["max_tokens"])
+                if max_tokens is not None: p.max_tokens = max_tokens
                 
                 save_config(cfg)
                 return "Primary provider updated."
@@ -549,21 +558,32 @@ class ToolAdapter:
         else:
             return f"Unknown action: {action}. Valid actions: start, stop, status, configure, trigger"
 
+    def get_tool_definitions_map(self) -> Dict[str, Dict[str, Any]]:
+        """Return {tool name: OpenAI-compatible definition}, built once per skill set.
+
+        The definitions are shared between calls; treat them as read-only.
+        """
+        defs = self._defs_map
+        if defs is None:
+            # Use registry schemas if available, otherwise fallback to local skills
+            # But to ensure full compatibility with existing code that might rely on self.skills:
+            defs = {
+                name: {
+                    "type": "function",
+                    "function": {
+                        "name": name,
+                        "description": tool.description,
+                        "parameters": tool.parameters
+                    }
+                }
+                for name, tool in self.skills.items()
+            }
+            self._defs_map = defs
+        return defs
+
     def get_tool_definitions(self) -> List[Dict[str, Any]]:
         """Return OpenAI-compatible tool definitions."""
-        tools = []
-        # Use registry schemas if available, otherwise fallback to local skills
-        # But to ensure full compatibility with existing code that might rely on self.skills:
-        for name, tool in self.skills.items():
-            tools.append({
-                "type": "function",
-                "function": {
-                    "name": name,
-                    "description": tool.description,
-                    "parameters": tool.parameters
-                }
-            })
-        return tools
+        return list(self.get_tool_definitions_map().values())
 
     def execute(self, tool_name: str, arguments: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> str:
         """
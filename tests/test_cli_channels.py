@@ -0,0 +1,57 @@
+import contextlib
+import io
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from swarmbot import cli
+from swarmbot.config_manager import ChannelConfig, SwarmbotConfig
+
+
+class TestChannelsEnable(unittest.TestCase):
+    def setUp(self):
+        self.cfg = SwarmbotConfig()
+        for name, value in (("load_config", lambda: self.cfg), ("save_config", mock.Mock())):
+            patcher = mock.patch.object(cli, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _enable(self, args):
+        out, err = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            cli.cmd_channels_enable("feishu", args, quiet=True)
+        return out.getvalue(), err.getvalue()
+
+    def test_missing_required_keys_refuse_to_enable(self):
+        with mock.patch("builtins.input", side_effect=AssertionError("prompted")):
+            with self.assertRaises(SystemExit) as ctx:
+                self._enable(["encrypt_key=x"])
+        self.assertEqual(ctx.exception.code, 1)
+        cli.save_config.assert_not_called()
+        self.assertNotIn("feishu", self.cfg.channels)
+
+    def test_missing_keys_are_listed(self):
+        err = io.StringIO()
+        with contextlib.redirect_stderr(err), self.assertRaises(SystemExit):
+            cli.cmd_channels_enable("feishu", ["app_id=a"], quiet=True)
+        self.assertIn("app_secret", err.getvalue())
+        self.assertNotIn("app_id", err.getvalue())
+
+    def test_keys_already_configured_count(self):
+        self.cfg.channels["feishu"] = ChannelConfig(config={"appId": "a", "app_secret": "s"})
+        self._enable(["encrypt_key=x"])
+        self.assertTrue(self.cfg.channels["feishu"].enabled)
+        cli.save_config.assert_called_once()
+
+    def test_complete_keys_enable_channel(self):
+        self._enable(["app_id=a", "app_secret=s"])
+        ch = self.cfg.channels["feishu"]
+        self.assertTrue(ch.enabled)
+        self.assertEqual((ch.config["app_id"], ch.config["app_secret"]), ("a", "s"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import contextlib
+import io
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from swarmbot import cli
+
+
+# Minimal valid argv for every subcommand.
+COMMAND_ARGV = {
+    "onboard": ["onboard"],
+    "run": ["run"],
+    "gateway": ["gateway"],
+    "heartbeat": ["heartbeat", "status"],
+    "tool": ["tool"],
+    "channels": ["channels"],
+    "cron": ["cron", "list"],
+    "agent": ["agent"],
+    "status": ["status"],
+    "provider": ["provider", "add", "--base-url", "http://x", "--api-key", "k", "--model", "m"],
+    "config": ["config", "--max-agents", "3"],
+    "skill": ["skill"],
+    "daemon": ["daemon", "start"],
+    "autonomous": ["autonomous", "start"],
+    "update": ["update"],
+}
+
+
+class TestCliParser(unittest.TestCase):
+    def _run_main(self, argv):
+        out, err = io.StringIO(), io.StringIO()
+        with mock.patch.object(sys, "argv", ["swarmbot"] + argv), \
+                contextlib.redirect_stdout(out), contextlib.redirect_stderr(err), \
+                self.assertRaises(SystemExit) as ctx:
+            cli.main()
+        return ctx.exception.code, out.getvalue(), err.getvalue()
+
+    def test_every_subcommand_is_covered(self):
+        self.assertEqual(set(COMMAND_ARGV), set(cli._SUBPARSER_BUILDERS))
+
+    def test_each_subcommand_sets_func(self):
+        for name, argv in COMMAND_ARGV.items():
+            with self.subTest(command=name):
+                self.assertEqual(cli._sniff_subcommand(["swarmbot"] + argv), name)
+                args, _ = cli._build_parser(name).parse_known_args(argv)
+                self.assertEqual(args.command, name)
+                self.assertTrue(callable(args.func))
+                # The full parser resolves the same command.
+                full, _ = cli._build_parser().parse_known_args(argv)
+                self.assertEqual(full.command, name)
+                self.assertTrue(callable(full.func))
+
+    def test_flags_before_subcommand(self):
+        argv = ["swarmbot", "--verbose", "daemon", "start"]
+        self.assertEqual(cli._sniff_subcommand(argv), "daemon")
+        args, extra = cli._build_parser("daemon").parse_known_args(argv[1:])
+        self.assertEqual((args.command, args.action), ("daemon", "start"))
+        self.assertEqual(extra, ["--verbose"])
+
+        # A top-level --help ahead of a command still lists every command.
+        self.assertIsNone(cli._sniff_subcommand(["swarmbot", "--help", "daemon"]))
+        code, out, _ = self._run_main(["--help", "daemon"])
+        self.assertEqual(code, 0)
+        for name in cli._SUBPARSER_BUILDERS:
+            self.assertIn(name, out)
+
+    def test_unknown_or_missing_subcommand_shows_all_commands(self):
+        for argv in (["bogus"], []):
+            with self.subTest(argv=argv):
+                self.assertIsNone(cli._sniff_subcommand(["swarmbot"] + argv))
+                code, _, err = self._run_main(argv)
+                self.assertEqual(code, 2)
+                for name in cli._SUBPARSER_BUILDERS:
+                    self.assertIn(name, err)
+
+
+if __name__ == "__main__":
+    unittest.main()
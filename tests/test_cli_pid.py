@@ -0,0 +1,46 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from swarmbot import cli
+
+
+class TestPidHelpers(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="swarmbot_test_pid_")
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.pid_file = os.path.join(self.tmp, "daemon.pid")
+
+    def _write(self, text):
+        with open(self.pid_file, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_missing_pidfile(self):
+        self.assertIsNone(cli._read_pid(self.pid_file))
+
+    def test_garbage_pidfile(self):
+        for text in ("", "not-a-pid", "0", "-1", "12 34"):
+            with self.subTest(text=text):
+                self._write(text)
+                self.assertIsNone(cli._read_pid(self.pid_file))
+
+    def test_stale_pid_is_not_alive(self):
+        proc = subprocess.Popen([sys.executable, "-c", "pass"])
+        proc.wait()
+        self._write(f"{proc.pid}\n")
+        self.assertEqual(cli._read_pid(self.pid_file), proc.pid)
+        self.assertFalse(cli._alive(proc.pid))
+
+    def test_live_pid_is_alive(self):
+        self._write(str(os.getpid()))
+        self.assertEqual(cli._read_pid(self.pid_file), os.getpid())
+        self.assertTrue(cli._alive(os.getpid()))
+
+
+if __name__ == "__main__":
+    unittest.main()
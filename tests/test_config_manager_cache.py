@@ -0,0 +1,161 @@
+import json
+import os
+import shutil
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+class TestConfigManagerCache(unittest.TestCase):
+    def setUp(self):
+        self.test_home = "/tmp/swarmbot_test_home_config_cache"
+        if os.path.exists(self.test_home):
+            shutil.rmtree(self.test_home)
+        os.makedirs(self.test_home, exist_ok=True)
+
+        self._old_home = os.environ.get("HOME")
+        os.environ["HOME"] = self.test_home
+
+        if "swarmbot.config_manager" in sys.modules:
+            del sys.modules["swarmbot.config_manager"]
+
+    def tearDown(self):
+        if self._old_home is None:
+            os.environ.pop("HOME", None)
+        else:
+            os.environ["HOME"] = self._old_home
+
+        if os.path.exists(self.test_home):
+            shutil.rmtree(self.test_home)
+
+    def test_repeated_loads_share_cached_config(self):
+        import swarmbot.config_manager as cm
+
+        cfg = cm.load_config()
+        self.assertIs(cm.load_config(), cfg)
+
+    def test_save_refreshes_cache(self):
+        import swarmbot.config_manager as cm
+
+        cfg = cm.load_config()
+        cfg.swarm.max_agents = 7
+        cm.save_config(cfg)
+        self.assertEqual(cm.load_config().swarm.max_agents, 7)
+
+    def test_external_edit_is_picked_up(self):
+        import swarmbot.config_manager as cm
+
+        cm.load_config()
+        with open(cm.CONFIG_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        data["swarm"]["max_turns"] = 99
+        with open(cm.CONFIG_PATH, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        self.assertEqual(cm.load_config().swarm.max_turns, 99)
+
+    def test_invalidate_forces_reread(self):
+        import swarmbot.config_manager as cm
+
+        cfg = cm.load_config()
+        cm.invalidate_config_cache()
+        reloaded = cm.load_config()
+        self.assertIsNot(reloaded, cfg)
+        self.assertEqual(reloaded, cfg)
+
+    def test_failed_tool_update_does_not_leak_into_cache(self):
+        import swarmbot.config_manager as cm
+        from swarmbot.tools.adapter import ToolAdapter
+
+        before = cm.load_config().swarm.architecture
+        adapter = ToolAdapter()
+        with self.assertRaises(ValueError):
+            adapter._tool_swarm_control(
+                "config", None, {"architecture": "leaked", "max_turns": "many"}
+            )
+        self.assertEqual(cm.load_config().swarm.architecture, before)
+
+        with self.assertRaises(ValueError):
+            adapter._tool_swarm_control(
+                "provider", "add", {"model": "leaked", "max_tokens": "lots"}
+            )
+        self.assertNotEqual(cm.load_config().providers[0].model, "leaked")
+
+    def test_load_after_save_exports_provider_env(self):
+        import swarmbot.config_manager as cm
+
+        cfg = cm.load_config()
+        with mock.patch.dict(os.environ, {}):
+            cfg.providers[0].base_url = "http://a"
+            cm.save_config(cfg)
+            cm.load_config()
+            self.assertEqual(os.environ.get("OPENAI_API_BASE"), "http://a")
+            cfg.providers[0].base_url = "http://b"
+            cm.save_config(cfg)
+            cm.load_config()
+            self.assertEqual(os.environ.get("OPENAI_API_BASE"), "http://b")
+
+    def test_identical_save_does_not_rewrite(self):
+        import swarmbot.config_manager as cm
+
+        cfg = cm.load_config()
+        cm.save_config(cfg)
+        before = os.stat(cm.CONFIG_PATH)
+        cm.save_config(cfg)
+        after = os.stat(cm.CONFIG_PATH)
+        self.assertEqual(
+            (after.st_ino, after.st_mtime_ns), (before.st_ino, before.st_mtime_ns)
+        )
+
+    def test_save_keeps_file_mode(self):
+        import swarmbot.config_manager as cm
+
+        cfg = cm.load_config()
+        os.chmod(cm.CONFIG_PATH, 0o640)
+        cfg.swarm.max_agents = 9
+        cm.save_config(cfg)
+        self.assertEqual(os.stat(cm.CONFIG_PATH).st_mode & 0o777, 0o640)
+
+    def test_new_file_gets_umask_default_mode(self):
+        import swarmbot.config_manager as cm
+
+        umask = os.umask(0o022)
+        os.umask(umask)
+        cm.load_config()  # no config.json yet: writes the default one
+        self.assertEqual(os.stat(cm.CONFIG_PATH).st_mode & 0o777, 0o666 & ~umask)
+
+    def test_failed_write_keeps_old_file(self):
+        import swarmbot.config_manager as cm
+
+        cfg = cm.load_config()
+        with open(cm.CONFIG_PATH, "rb") as f:
+            original = f.read()
+        cfg.swarm.max_agents = 11
+        with mock.patch.object(cm.os, "replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                cm.save_config(cfg)
+        with open(cm.CONFIG_PATH, "rb") as f:
+            self.assertEqual(f.read(), original)
+        self.assertEqual(
+            [n for n in os.listdir(cm.CONFIG_HOME) if n.endswith(".tmp")], []
+        )
+        self.assertNotEqual(cm.load_config().swarm.max_agents, 11)
+
+    def test_fsync_is_opt_in(self):
+        import swarmbot.config_manager as cm
+
+        cfg = cm.load_config()
+        sync_name = "fdatasync" if hasattr(os, "fdatasync") else "fsync"
+        with mock.patch.object(cm.os, sync_name) as sync:
+            cfg.swarm.max_agents = 4
+            cm.save_config(cfg)
+            self.assertEqual(sync.call_count, 0)
+            with mock.patch.dict(os.environ, {"SWARMBOT_CONFIG_FSYNC": "1"}):
+                cfg.swarm.max_agents = 5
+                cm.save_config(cfg)
+            self.assertEqual(sync.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
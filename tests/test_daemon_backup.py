@@ -0,0 +1,167 @@
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from swarmbot import daemon
+
+
+class TestPruneBackups(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="swarmbot_test_backups_")
+        patcher = mock.patch.object(daemon, "BACKUP_ROOT", self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.root, True)
+
+    def _make(self, *names):
+        for name in names:
+            os.makedirs(os.path.join(self.root, name))
+
+    def test_keeps_newest_backups(self):
+        self._make("backup_20240101_000000", "backup_20240102_000000", "backup_20240103_000000")
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            daemon._prune_backups(2)
+        self.assertIn("[Daemon] Pruned 1 old backup(s)", out.getvalue())
+        self.assertEqual(
+            sorted(os.listdir(self.root)),
+            ["backup_20240102_000000", "backup_20240103_000000"],
+        )
+
+    def test_ignores_other_entries(self):
+        self._make("backup_20240101_000000", "backup_20240102_000000", "manual_copy")
+        daemon._prune_backups(1)
+        self.assertEqual(sorted(os.listdir(self.root)), ["backup_20240102_000000", "manual_copy"])
+
+    def test_zero_keeps_all(self):
+        names = ["backup_20240101_000000", "backup_20240102_000000"]
+        self._make(*names)
+        daemon._prune_backups(0)
+        self.assertEqual(sorted(os.listdir(self.root)), names)
+
+
+class TestSnapshotCopy(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="swarmbot_test_snapshot_")
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.src = os.path.join(self.tmp, "boot")
+        os.makedirs(self.src)
+        self._write("SOUL.md", "soul")
+        self._write("USER.md", "user")
+
+    def _write(self, name, text):
+        with open(os.path.join(self.src, name), "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def _path(self, *parts):
+        return os.path.join(self.tmp, *parts)
+
+    def test_unchanged_file_is_hardlinked_to_previous_backup(self):
+        daemon._copy_tree(self.src, self._path("b1"))
+        daemon._copy_tree(self.src, self._path("b2"), link_dest=self._path("b1"))
+        self.assertTrue(os.path.samefile(self._path("b1", "SOUL.md"), self._path("b2", "SOUL.md")))
+        self.assertGreater(os.stat(self._path("b2", "SOUL.md")).st_nlink, 1)
+        # The live file itself is never linked into a backup.
+        self.assertFalse(os.path.samefile(self._path("boot", "SOUL.md"), self._path("b1", "SOUL.md")))
+
+    def test_changed_file_gets_its_own_copy(self):
+        daemon._copy_tree(self.src, self._path("b1"))
+        self._write("USER.md", "user, edited")
+        daemon._copy_tree(self.src, self._path("b2"), link_dest=self._path("b1"))
+        self.assertFalse(os.path.samefile(self._path("b1", "USER.md"), self._path("b2", "USER.md")))
+        with open(self._path("b2", "USER.md"), encoding="utf-8") as f:
+            self.assertEqual(f.read(), "user, edited")
+        with open(self._path("b1", "USER.md"), encoding="utf-8") as f:
+            self.assertEqual(f.read(), "user")
+
+    def test_falls_back_to_copy_when_link_and_reflink_fail(self):
+        daemon._copy_tree(self.src, self._path("b1"))
+        with mock.patch.object(daemon.os, "link", side_effect=OSError("no links")), \
+                mock.patch.object(daemon, "fcntl", None):
+            daemon._copy_tree(self.src, self._path("b2"), link_dest=self._path("b1"))
+        self.assertFalse(os.path.samefile(self._path("b1", "SOUL.md"), self._path("b2", "SOUL.md")))
+        with open(self._path("b2", "SOUL.md"), encoding="utf-8") as f:
+            self.assertEqual(f.read(), "soul")
+        self.assertEqual(
+            os.stat(self._path("boot", "SOUL.md")).st_mtime_ns,
+            os.stat(self._path("b2", "SOUL.md")).st_mtime_ns,
+        )
+
+
+class TestBackupIfChanged(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="swarmbot_test_backup_")
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        self.config_path = os.path.join(self.tmp, "config.json")
+        self.boot = os.path.join(self.tmp, "boot")
+        self.backups = os.path.join(self.tmp, "backups")
+        os.makedirs(self.boot)
+        with open(self.config_path, "w", encoding="utf-8") as f:
+            f.write("{}")
+        self.soul = os.path.join(self.boot, "SOUL.md")
+        with open(self.soul, "w", encoding="utf-8") as f:
+            f.write("soul")
+        for name, value in (
+            ("CONFIG_PATH", self.config_path),
+            ("BOOT_CONFIG_PATH", self.boot),
+            ("BACKUP_ROOT", self.backups),
+        ):
+            patcher = mock.patch.object(daemon, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        # Distinct timestamps, so back-to-back backups get their own directory.
+        stamps = iter(f"20240101_0000{i:02d}" for i in range(60))
+        patcher = mock.patch.object(daemon.time, "strftime", side_effect=lambda fmt: next(stamps))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, state):
+        with mock.patch.object(daemon, "_hash_file", wraps=daemon._hash_file) as hash_file, \
+                mock.patch.object(daemon, "_hash_boot_dir", wraps=daemon._hash_boot_dir) as hash_boot:
+            state = daemon._perform_backup_if_changed(dict(state))
+        return state, hash_file.call_count, hash_boot.call_count
+
+    def test_unchanged_inputs_skip_hashing_and_backup(self):
+        state, _, _ = self._run({})
+        self.assertEqual(os.listdir(self.backups), ["backup_20240101_000000"])
+
+        again, config_hashes, boot_hashes = self._run(state)
+        self.assertEqual((config_hashes, boot_hashes), (0, 0))
+        self.assertEqual(again["last_backup_ts"], state["last_backup_ts"])
+        self.assertEqual(os.listdir(self.backups), ["backup_20240101_000000"])
+
+    def test_touched_file_is_rehashed_but_not_backed_up(self):
+        state, _, _ = self._run({})
+        st = os.stat(self.soul)
+        os.utime(self.soul, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        again, config_hashes, boot_hashes = self._run(state)
+        self.assertEqual((config_hashes, boot_hashes), (0, 1))
+        self.assertEqual(again["last_backup_ts"], state["last_backup_ts"])
+        self.assertEqual(os.listdir(self.backups), ["backup_20240101_000000"])
+        # The new stat metadata is recorded, so the next run skips hashing again.
+        _, _, boot_hashes = self._run(again)
+        self.assertEqual(boot_hashes, 0)
+
+    def test_changed_file_triggers_backup(self):
+        state, _, _ = self._run({})
+        with open(self.soul, "w", encoding="utf-8") as f:
+            f.write("soul, edited")
+
+        again, _, boot_hashes = self._run(state)
+        self.assertEqual(boot_hashes, 1)
+        self.assertNotEqual(again["last_boot_hash"], state["last_boot_hash"])
+        self.assertEqual(again["last_backup_ts"], "20240101_000001")
+        with open(os.path.join(self.backups, "backup_20240101_000001", "boot", "SOUL.md"), encoding="utf-8") as f:
+            self.assertEqual(f.read(), "soul, edited")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import asyncio
+import os
+import sys
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import swarmbot  # noqa: F401  (registers the vendored nanobot package)
+from nanobot.bus.events import OutboundMessage
+from nanobot.bus.queue import MessageBus
+from nanobot.channels import feishu
+from nanobot.config.schema import FeishuConfig
+
+
+class _StubResponse:
+    code = 0
+    msg = "ok"
+
+    def success(self):
+        return True
+
+    def get_log_id(self):
+        return "log"
+
+
+class TestFeishuSend(unittest.TestCase):
+    def setUp(self):
+        # Request builders come from lark_oapi, which is optional; any chain works.
+        for name in ("CreateMessageRequest", "CreateMessageRequestBody"):
+            patcher = mock.patch.object(feishu, name, mock.MagicMock(), create=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.channel = feishu.FeishuChannel(FeishuConfig(), MessageBus())
+        self.create_threads = []
+
+    def _use_create(self, create):
+        self.channel._client = SimpleNamespace(
+            im=SimpleNamespace(v1=SimpleNamespace(message=SimpleNamespace(create=create)))
+        )
+
+    def _send(self):
+        async def run():
+            loop_thread = threading.get_ident()
+            await self.channel.send(OutboundMessage(channel="feishu", chat_id="oc_1", content="hi"))
+            return loop_thread
+
+        return asyncio.run(run())
+
+    def test_create_runs_off_the_event_loop(self):
+        def create(request):
+            self.create_threads.append(threading.get_ident())
+            return _StubResponse()
+
+        self._use_create(create)
+        loop_thread = self._send()
+        self.assertEqual(len(self.create_threads), 1)
+        self.assertNotEqual(self.create_threads[0], loop_thread)
+
+    def test_create_errors_are_logged(self):
+        def create(request):
+            raise RuntimeError("boom")
+
+        self._use_create(create)
+        with mock.patch.object(feishu, "logger") as logger:
+            self._send()
+        logger.error.assert_called_once()
+        self.assertIn("boom", logger.error.call_args[0][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from swarmbot.memory.qmd_wrapper import EmbeddedQMD
+
+
+def test_qmd_search_cache_refreshes_on_add():
+    with tempfile.TemporaryDirectory() as td:
+        store = EmbeddedQMD(td)
+        store.add("apples are red", collection="default")
+        first = store.search("apples", limit=5)
+        assert [r["content"] for r in first] == ["apples are red"]
+
+        # Cached copies must not leak caller mutations.
+        first[0]["content"] = "mutated"
+        assert store.search("apples", limit=5)[0]["content"] == "apples are red"
+
+        store.add("green apples too", collection="default")
+        assert len(store.search("apples", limit=5)) == 2
+
+
+if __name__ == "__main__":
+    test_qmd_search_cache_refreshes_on_add()
+    print("qmd search cache test passed")
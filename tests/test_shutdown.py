@@ -0,0 +1,61 @@
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import unittest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+class TestSetOnSignals(unittest.TestCase):
+    def _run(self, body):
+        # Signal handlers are process-wide, so exercise them in a child process.
+        script = textwrap.dedent(
+            """
+            import os, signal, sys, threading, time
+            sys.path.insert(0, %r)
+            from swarmbot.shutdown import set_on_signals
+            event = threading.Event()
+            set_on_signals(event)
+            """ % ROOT
+        ) + textwrap.dedent(body)
+        return subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, timeout=30
+        )
+
+    def test_sigterm_wakes_a_blocking_wait(self):
+        result = self._run(
+            """
+            threading.Timer(0.2, os.kill, (os.getpid(), signal.SIGTERM)).start()
+            print(event.wait(10))
+            """
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "True")
+
+    def test_sigint_does_not_raise(self):
+        result = self._run(
+            """
+            os.kill(os.getpid(), signal.SIGINT)
+            print(event.wait(10))
+            """
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "True")
+
+    @unittest.skipUnless(hasattr(signal, "SIGUSR1"), "needs SIGUSR1")
+    def test_other_signals_are_ignored(self):
+        result = self._run(
+            """
+            signal.signal(signal.SIGUSR1, lambda *a: None)
+            os.kill(os.getpid(), signal.SIGUSR1)
+            print(event.wait(0.5))
+            """
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()